@@ -0,0 +1,176 @@
+"""
+Microbenchmarks of data_cleaner and data_analyzer on synthetic datasets.
+
+Times every cleaning and analysis function, and the full clean and analyze pipelines, for each dataset
+size. Geocoding is replaced by an in-memory stub, so the runs measure only local work.
+
+    python -m benchmarks.cleaning_benchmark --sizes 1000 100000 1000000
+    python -m benchmarks.cleaning_benchmark --save       # store the results as the baseline
+    python -m benchmarks.cleaning_benchmark --compare    # exit with 1 if a case got slower than the baseline
+
+Sizes above 100k run each case once; smaller ones keep the best of --repeat runs.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections import namedtuple
+
+import data_analyzer
+import data_cleaner
+from benchmarks.results import DEFAULT_TOLERANCE, finish
+from benchmarks.synthetic_data import generate_persons
+
+SUITE = "cleaning"
+DEFAULT_SIZES = (1000, 100000, 1000000)
+
+Coordinates = namedtuple("Coordinates", "latitude longitude")
+
+
+def stub_geocoder(location):
+    """Geocoder without network: deterministic coordinates from the text of the location."""
+    seed = sum(map(ord, location))
+    return Coordinates(seed % 180 - 90, seed % 360 - 180)
+
+
+def stub_geocoding_cache():
+    return data_cleaner.GeocodingCache(cache_path=None, geocoder=stub_geocoder)
+
+
+def size_label(size):
+    for factor, suffix in ((1_000_000, "M"), (1_000, "k")):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{suffix}"
+    return str(size)
+
+
+def best_time(function, prepare, repeat):
+    """Best time of function(prepare()) over repeat runs; prepare is not timed."""
+    best = float("inf")
+    for _ in range(repeat):
+        argument = prepare()
+        started = time.perf_counter()
+        function(argument)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def cleaning_cases(processes):
+    """Cases that take the raw persons (a fresh copy on every run)."""
+    return {
+        "clean_title": lambda persons: [data_cleaner.clean_title(person["title"]) for person in persons],
+        "classify_title": lambda persons: [data_cleaner.classify_title(person["title"]) for person in persons],
+        "extract_keywords": lambda persons: [data_cleaner.extract_keywords(person["title"]) for person in persons],
+        "clean_location": lambda persons: [data_cleaner.clean_location(person["location"]) for person in persons],
+        "clean_persons": lambda persons: data_cleaner.clean_persons(persons),
+        "process_data": lambda persons: data_cleaner.process_data(persons, geocoding_cache=stub_geocoding_cache()),
+        "process_stream": lambda persons: run_process_stream(persons, processes),
+    }
+
+
+def analysis_cases():
+    """Cases that take the cleaned persons."""
+    return {
+        "count_occurrences": lambda data: data_analyzer.count_occurrences(data, "title_category"),
+        "analyze_most_frequent_titles": data_analyzer.analyze_most_frequent_titles,
+        "analyze_province_distribution": data_analyzer.analyze_province_distribution,
+        "analyze_country_percentage": data_analyzer.analyze_country_percentage,
+        "calculate_completion_percentage": lambda data: [data_analyzer.calculate_completion_percentage(data, key)
+                                                         for key in data_analyzer.COMPLETION_KEYS],
+        "default_aggregator": lambda data: data_analyzer.default_aggregator().run(data),
+        "columnar_dataset": data_analyzer.ColumnarDataset,
+        "columnar_analysis": run_columnar_analysis,
+    }
+
+
+# Keys counted by the consistency check: a column of the dataset and keys only the list path handles
+OCCURRENCE_KEYS = ("title_category", "country", "cleaned_location", "cleaned_title", "title_keywords")
+
+
+def check_columnar(data):
+    """
+    Runs every analysis on the list of persons and on its ColumnarDataset and returns the names of the
+    analyses whose results differ, so the timings are only compared between equivalent implementations.
+    """
+    dataset = data_analyzer.ColumnarDataset(data)
+    analyses = {f"count_occurrences[{key}]": lambda data, key=key: data_analyzer.count_occurrences(data, key)
+                for key in OCCURRENCE_KEYS}
+    analyses.update({
+        "analyze_most_frequent_titles": data_analyzer.analyze_most_frequent_titles,
+        "analyze_province_distribution": data_analyzer.analyze_province_distribution,
+        "analyze_country_percentage": data_analyzer.analyze_country_percentage,
+        "default_aggregator": lambda data: data_analyzer.default_aggregator().run(data),
+    })
+    analyses.update({f"calculate_completion_percentage[{key}]":
+                     lambda data, key=key: data_analyzer.calculate_completion_percentage(data, key)
+                     for key in data_analyzer.COMPLETION_KEYS})
+    return [name for name, analysis in analyses.items() if analysis(data) != analysis(dataset)]
+
+
+def run_process_stream(persons, processes):
+    with tempfile.TemporaryDirectory() as folder:
+        return data_cleaner.process_stream(iter(persons), os.path.join(folder, "cleaned.jsonl"),
+                                           geocoding_cache=stub_geocoding_cache(), processes=processes)
+
+
+def run_columnar_analysis(data):
+    return data_analyzer.default_aggregator().run(data_analyzer.ColumnarDataset(data))
+
+
+def run_pipeline(persons):
+    """Full cleaning followed by every analysis, as data_cleaner.py + data_analyzer.py do."""
+    data = data_cleaner.process_data(persons, geocoding_cache=stub_geocoding_cache())
+    return run_columnar_analysis(data)
+
+
+def run_size(size, repeat, processes, selected=None):
+    """Runs every case (or the selected ones) for a dataset size."""
+    results = {}
+    label = size_label(size)
+    fresh = lambda: list(generate_persons(size))
+
+    def record(name, seconds):
+        results[f"{name}/{label}"] = {"size": size, "seconds": seconds, "records_per_sec": size / seconds}
+        print(f"  {name:<32} {seconds:10.3f}s {size / seconds:14,.0f} records/s")
+
+    print(f"\n{label} records:")
+    for name, function in cleaning_cases(processes).items():
+        if not selected or name in selected:
+            record(name, best_time(function, fresh, repeat))
+
+    cleaned = data_cleaner.clean_persons(fresh())
+    mismatches = check_columnar(cleaned)
+    if mismatches:
+        raise AssertionError(f"ColumnarDataset results differ from the list results: {', '.join(mismatches)}")
+    for name, function in analysis_cases().items():
+        if not selected or name in selected:
+            record(name, best_time(function, lambda: cleaned, repeat))
+    del cleaned
+
+    if not selected or "pipeline" in selected:
+        record("pipeline", best_time(run_pipeline, fresh, repeat))
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks of data_cleaner and data_analyzer.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--processes", type=int, default=None, help="Processes used by process_stream")
+    parser.add_argument("--only", nargs="+", help="Names of the cases to run")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail if a case is slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results = {}
+    for size in args.sizes:
+        repeat = args.repeat if size <= 100_000 else 1
+        results.update(run_size(size, repeat, args.processes, args.only))
+
+    sys.exit(finish(SUITE, results, args.save, args.compare, args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
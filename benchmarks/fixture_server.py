@@ -0,0 +1,251 @@
+"""
+Local stand-in for the LinkedIn pages the scraper visits, to benchmark and test it without a real account.
+
+Serves a fake login and feed, a connections list of N lazily loaded connection cards and a contact-info
+overlay per connection, with the markup Person extracts from. Every page but the login page and
+robots.txt needs the li_at cookie set by the login form, as on LinkedIn.
+
+    python -m benchmarks.fixture_server --connections 1000 --port 8000
+"""
+import argparse
+import html
+import json
+import re
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from benchmarks.synthetic_data import synthetic_person
+
+SESSION_COOKIE = "li_at"
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>LinkedIn Login</title></head><body>
+<form method="post" action="/login">
+  <input id="username" name="session_key" type="text">
+  <input id="password" name="session_password" type="password">
+  <button type="submit">Sign in</button>
+</form>
+</body></html>"""
+
+FEED_PAGE = """<!DOCTYPE html>
+<html><head><title>Feed | LinkedIn</title></head><body>
+<main><button class="share-box-feed-entry__trigger">Start a post</button>
+<div class="feed-shared-update-v2">Update</div></main>
+</body></html>"""
+
+# Renders the connection cards in batches as the list is scrolled to the bottom, like the real infinite list
+CONNECTIONS_PAGE = """<!DOCTYPE html>
+<html><head><title>Connections | LinkedIn</title>
+<style>.mn-connection-card {{ height: 80px; }}</style></head><body>
+<main><ul id="connections"></ul></main>
+<script>
+  const total = {total}, batch = {batch}, delay = {delay};
+  let shown = 0, loading = false;
+  function render() {{
+    const list = document.getElementById('connections');
+    const end = Math.min(total, shown + batch);
+    for (let i = shown; i < end; i++) {{
+      const item = document.createElement('li');
+      item.className = 'mn-connection-card';
+      item.innerHTML = '<div class="mn-connection-card__details"><a href="/in/p' + i + '/">'
+        + '<span class="mn-connection-card__name">Connection ' + i + '</span></a></div>';
+      list.appendChild(item);
+    }}
+    shown = end;
+  }}
+  render();
+  window.addEventListener('scroll', () => {{
+    if (loading || shown >= total) return;
+    if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 100) {{
+      loading = true;
+      setTimeout(() => {{ render(); loading = false; }}, delay);
+    }}
+  }});
+</script>
+</body></html>"""
+
+CONTACT_INFO_PAGE = """<!DOCTYPE html>
+<html><head><title>{name} | LinkedIn</title></head><body>
+<section class="pv-top-card">
+  <img class="pv-top-card-profile-picture__container" src="{photo}">
+  <div class="text-body-medium break-words">{title}</div>
+  <span class="text-body-small inline t-black--light break-words">{location}</span>
+</section>
+<div role="dialog" aria-labelledby="pv-contact-info">
+  <h1 id="pv-contact-info">{name}</h1>
+  <section class="pv-contact-info__contact-type">
+    <h3>{name}'s Profile</h3>
+    <div class="pv-top-card--list"><li><a href="{profile}">{profile}</a></li></div>
+  </section>
+  {sections}
+</div>
+</body></html>"""
+
+# Page whose content only exists once its script has run, like most of the real LinkedIn UI
+JS_RENDERED_PAGE = """<!DOCTYPE html>
+<html><head><title>LinkedIn</title></head><body>
+<div id="app"></div>
+<script>document.getElementById('app').innerHTML = {markup};</script>
+</body></html>"""
+
+
+def contact_info_html(person: dict, profile: str) -> str:
+    sections = []
+    if person["website"]:
+        sections.append('<section class="pv-contact-info__contact-type"><h3>Website</h3>'
+                        f'<a class="pv-contact-info__contact-link" href="https://{person["website"]}">'
+                        f'{html.escape(person["website"])}</a></section>')
+    for field, (h3_text, tag) in (("phone", ("Phone", "span")), ("email", ("Email", "a")),
+                                  ("birthday", ("Birthday", "span")), ("address", ("Address", "span"))):
+        if person[field]:
+            sections.append(f'<section class="pv-contact-info__contact-type"><h3>{h3_text}</h3>'
+                            f'<{tag}>{html.escape(person[field])}</{tag}></section>')
+    return CONTACT_INFO_PAGE.format(
+        name=html.escape(person["name"]), title=html.escape(person["title"]),
+        location=html.escape(person["location"]), photo=person["photo"], profile=profile,
+        sections="\n  ".join(sections),
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, delayed ACKs add ~40ms to keep-alive responses
+    disable_nagle_algorithm = True
+    server: "StandInServer"
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        path = urlsplit(self.path).path
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.server.count(path)
+
+        if path == "/robots.txt":
+            return self._send(200, "User-agent: *\nDisallow:\n", "text/plain")
+        if path in ("/login", "/login/"):
+            if self._logged_in():
+                return self._redirect("/feed/")
+            return self._send(200, LOGIN_PAGE)
+        if not self._logged_in():
+            return self._redirect("/login")
+        if path in ("/feed", "/feed/"):
+            return self._send(200, FEED_PAGE)
+        if path == "/mynetwork/invite-connect/connections/":
+            return self._send(200, CONNECTIONS_PAGE.format(total=self.server.connections, batch=self.server.batch,
+                                                           delay=int(self.server.render_delay * 1000)))
+        match = re.fullmatch(r"/in/p(\d+)/overlay/contact-info/?", path)
+        if match and int(match.group(1)) < self.server.connections:
+            index = int(match.group(1))
+            profile = f"{self.server.base_url}/in/p{index}/"
+            page = contact_info_html(synthetic_person(index, self.server.seed), profile)
+            if self.server.js_rendered_every and index % self.server.js_rendered_every == 0:
+                body = page.split("<body>", 1)[1].rsplit("</body>", 1)[0]
+                page = JS_RENDERED_PAGE.format(markup=json.dumps(body))
+            return self._send(200, page)
+        return self._send(404, "<html><body>Not found</body></html>")
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if urlsplit(self.path).path.rstrip("/") != "/login":
+            return self._send(404, "<html><body>Not found</body></html>")
+        token = uuid.uuid4().hex
+        self.server.sessions.add(token)
+        self.send_response(303)
+        self.send_header("Location", "/feed/")
+        self.send_header("Set-Cookie", f"{SESSION_COOKIE}={token}; Path=/; Max-Age=86400; HttpOnly")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _logged_in(self) -> bool:
+        cookies = self.headers.get("Cookie", "")
+        match = re.search(rf"(?:^|;\s*){SESSION_COOKIE}=([^;]+)", cookies)
+        return bool(match) and match.group(1) in self.server.sessions
+
+    def _redirect(self, location: str):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status: int, body: str, content_type: str = "text/html"):
+        payload = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, connections: int = 100, host: str = "127.0.0.1", port: int = 0, batch: int = 40,
+                 render_delay: float = 0.05, latency: float = 0.0, seed: int = 0, js_rendered_every: int = 0):
+        """
+        HTTP server standing in for LinkedIn.
+        :param connections: Number of connections in the connections list.
+        :param host: Interface to listen on.
+        :param port: Port to listen on; 0 picks a free one.
+        :param batch: Number of connection cards rendered per scroll.
+        :param render_delay: Seconds the connections list takes to render the next batch of cards.
+        :param latency: Seconds added to every GET request, to simulate the network.
+        :param seed: Seed of the synthetic persons.
+        :param js_rendered_every: Every how many connections the contact-info page is rendered by a script
+                                  (0 for none), to exercise the browser fallback of the HTTP fetcher.
+        """
+        super().__init__((host, port), StandInHandler)
+        self.connections = connections
+        self.batch = batch
+        self.render_delay = render_delay
+        self.latency = latency
+        self.seed = seed
+        self.js_rendered_every = js_rendered_every
+        self.sessions = set()
+        self.requests = {}
+        self._lock = threading.Lock()
+        self.base_url = f"http://{host}:{self.server_address[1]}"
+
+    def count(self, path: str) -> None:
+        page = "contact_info" if "/overlay/contact-info" in path else path
+        with self._lock:
+            self.requests[page] = self.requests.get(page, 0) + 1
+
+    def start(self) -> "StandInServer":
+        """
+        Serves requests in a background thread.
+        """
+        threading.Thread(target=self.serve_forever, name="stand-in-server", daemon=True).start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the LinkedIn pages the scraper visits.")
+    parser.add_argument("--connections", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added to every request")
+    parser.add_argument("--js-rendered-every", type=int, default=0,
+                        help="Render every Nth contact-info page with JavaScript")
+    args = parser.parse_args()
+
+    server = StandInServer(args.connections, host=args.host, port=args.port, latency=args.latency,
+                           js_rendered_every=args.js_rendered_every)
+    print(f"Serving {args.connections} connections on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
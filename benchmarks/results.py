@@ -0,0 +1,85 @@
+"""
+Storage and comparison of benchmark results.
+
+Results map each benchmark case to its measurements, and every case has a 'seconds' measurement that
+is compared against the stored baseline: a case more than 'tolerance' slower than its baseline fails,
+unless it is only a few milliseconds slower (timer noise on very short cases).
+Baselines depend on the machine, so they are stored under benchmarks/results/ and not committed.
+"""
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DEFAULT_TOLERANCE = 0.2
+# Slowdowns below this many seconds are ignored
+MIN_SLOWDOWN_SECONDS = 0.005
+
+
+def baseline_path(name: str) -> Path:
+    return RESULTS_DIR / f"{name}.json"
+
+
+def save_results(name: str, results: dict) -> Path:
+    """
+    Stores the results as the baseline of a benchmark suite.
+    :param name: Name of the suite (e.g. 'scrape').
+    :param results: Case -> measurements, each with a 'seconds' entry.
+    :return: Path of the stored baseline.
+    """
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    path = baseline_path(name)
+    document = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": sys.version.split()[0],
+        "machine": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w", encoding='utf-8') as file:
+        json.dump(document, file, ensure_ascii=False, indent=2)
+    return path
+
+
+def compare_results(name: str, results: dict, tolerance: float = DEFAULT_TOLERANCE) -> list:
+    """
+    Compares the results with the stored baseline of a benchmark suite.
+    :param name: Name of the suite.
+    :param results: Case -> measurements, each with a 'seconds' entry.
+    :param tolerance: Allowed slowdown, as a fraction of the baseline time.
+    :return: Descriptions of the cases that got slower than allowed.
+    """
+    path = baseline_path(name)
+    try:
+        with open(path, "r", encoding='utf-8') as file:
+            baseline = json.load(file)["results"]
+    except FileNotFoundError:
+        raise FileNotFoundError(f"No baseline at {path}. Run the benchmark with --save first.")
+
+    regressions = []
+    for case, measurements in results.items():
+        if case not in baseline:
+            continue
+        before, after = baseline[case]["seconds"], measurements["seconds"]
+        if after > before * (1 + tolerance) and after - before >= MIN_SLOWDOWN_SECONDS:
+            regressions.append(f"{case}: {after:.3f}s vs {before:.3f}s baseline (+{(after / max(before, 1e-9) - 1) * 100:.0f}%)")
+    return regressions
+
+
+def finish(name: str, results: dict, save: bool, compare: bool, tolerance: float = DEFAULT_TOLERANCE) -> int:
+    """
+    Saves and/or compares the results of a benchmark run.
+    :return: Exit code of the run: 1 if a comparison found regressions, 0 otherwise.
+    """
+    if compare:
+        regressions = compare_results(name, results, tolerance)
+        if regressions:
+            print(f"Slower than the {name} baseline (tolerance {tolerance:.0%}):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print(f"No regressions against the {name} baseline (tolerance {tolerance:.0%}).")
+    if save:
+        print(f"Baseline saved to {save_results(name, results)}")
+    return 0
\ No newline at end of file
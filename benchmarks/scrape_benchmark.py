@@ -0,0 +1,165 @@
+"""
+End-to-end scrape benchmark against the local stand-in server.
+
+Drives the real LinkedInAuthenticator, LinkedInConector and FileManager in headless Chrome: logs in,
+reads the whole connections list and gathers the contact info of every connection, and reports
+profiles/sec, the latency of every stage and the memory used, for each number of connections.
+
+    python -m benchmarks.scrape_benchmark --connections 100 1000 10000
+    python -m benchmarks.scrape_benchmark --http --js-rendered-every 10   # HTTP fetcher with browser fallback
+    python -m benchmarks.scrape_benchmark --save       # store the results as the baseline
+    python -m benchmarks.scrape_benchmark --compare    # exit with 1 if a case got slower than the baseline
+"""
+import argparse
+import json
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from benchmarks.fixture_server import StandInServer
+from benchmarks.results import DEFAULT_TOLERANCE, finish
+from src.browserPool import BrowserPool
+from src.httpFetcher import HttpContactFetcher
+from src.linkedIn_authenticator import LinkedInAuthenticator
+from src.linkedIn_conector import LinkedInConector
+from src.metrics import Metrics
+from src.pageWait import PageWaiter
+from src.rateScheduler import RateScheduler
+from src.storage import empty_layout
+from src.utils import chromeBrowserOptions
+from src.warmBrowser import resolve_driver_path
+
+SUITE = "scrape"
+DEFAULT_SIZES = (100, 1000, 10000)
+
+
+def headless_browser(lean: bool = False) -> webdriver.Chrome:
+    options = chromeBrowserOptions(use_profile=False, lean=lean)
+    options.add_argument("--headless=new")
+    return webdriver.Chrome(service=ChromeService(resolve_driver_path()), options=options)
+
+
+def browser_memory_mb(driver) -> float:
+    """
+    Resident memory of the browser started by a driver and its child processes, if psutil is installed.
+    """
+    try:
+        import psutil
+    except ImportError:
+        return float("nan")
+    try:
+        root = psutil.Process(driver.service.process.pid)
+        processes = [root] + root.children(recursive=True)
+        return sum(process.memory_info().rss for process in processes) / 2 ** 20
+    except psutil.Error:
+        return float("nan")
+
+
+def run_case(connections: int, workers: int = 1, extraction: str = "script", backend: str = "sqlite",
+             latency: float = 0.0, http: bool = False, http_concurrency: int = 8, js_rendered_every: int = 0) -> dict:
+    """
+    Scrapes a stand-in server with the given number of connections from an empty data folder.
+    :return: Measurements of the run.
+    """
+    server = StandInServer(connections, latency=latency, js_rendered_every=js_rendered_every).start()
+    browser = headless_browser()
+    try:
+        with tempfile.TemporaryDirectory() as data_folder:
+            data_folder = Path(data_folder)
+            connections_file = data_folder / "connections_links.json"
+            with open(connections_file, "w", encoding='utf-8') as file:
+                json.dump(empty_layout(), file)
+
+            waiter = PageWaiter()
+            metrics = Metrics()
+            auth = LinkedInAuthenticator(driver=browser, session_file=data_folder / "session.json", waiter=waiter,
+                                         base_url=server.base_url)
+            auth.set_secrets("benchmark@example.com", "benchmark")
+            started = time.perf_counter()
+            auth.start()
+            login_seconds = time.perf_counter() - started
+
+            # The stand-in server never throttles, so the scheduler must not limit the rate
+            scheduler = RateScheduler(rate_per_hour=10 ** 9, max_rate_per_hour=10 ** 9,
+                                      burst=max(workers, http_concurrency), slow_latency_factor=float("inf"))
+            conector = LinkedInConector(connections_file, driver=browser, storage_backend=backend,
+                                        extraction=extraction, scroll_stall_seconds=1, incremental_sync=False,
+                                        waiter=waiter, scheduler=scheduler, metrics=metrics, metrics_export="none",
+                                        base_url=server.base_url, show_terminal=False)
+            browser_pool = None
+            if workers > 1:
+                browser_pool = BrowserPool(headless_browser, workers - 1, cookies=auth.session_cookies(),
+                                           cookie_url=f"{server.base_url}/robots.txt")
+            http_fetcher = None
+            if http:
+                http_fetcher = HttpContactFetcher(auth.session_cookies(), concurrency=http_concurrency,
+                                                  user_agent=browser.execute_script("return navigator.userAgent;"))
+            started = time.perf_counter()
+            conector.start(browser_pool, http_fetcher)
+            seconds = time.perf_counter() - started
+            scraped = len(conector.fm.get_all_persons())
+            browser_mb = browser_memory_mb(browser)
+            conector.close()
+    finally:
+        browser.quit()
+        server.stop()
+
+    stages = metrics.summary()["stages"]
+    return {
+        "connections": connections,
+        "scraped": scraped,
+        "seconds": seconds,
+        "login_seconds": login_seconds,
+        "profiles_per_sec": scraped / seconds if seconds else 0.0,
+        "stages": stages,
+        "counters": metrics.summary()["counters"],
+        # ru_maxrss is in kilobytes on Linux
+        "python_peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+        "browser_mb": browser_mb,
+    }
+
+
+def print_case(case: str, result: dict) -> None:
+    print(f"\n{case}: {result['scraped']}/{result['connections']} profiles in {result['seconds']:.1f}s "
+          f"({result['profiles_per_sec']:.1f} profiles/sec), login {result['login_seconds']:.2f}s, "
+          f"python peak {result['python_peak_mb']:.0f} MB, browser {result['browser_mb']:.0f} MB")
+    for stage, stats in result["stages"].items():
+        print(f"  {stage:<12} n={stats['count']:<6} mean={stats['mean'] * 1000:8.1f}ms "
+              f"p50={stats['p50'] * 1000:8.1f}ms p95={stats['p95'] * 1000:8.1f}ms max={stats['max'] * 1000:8.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end scrape benchmark against a local stand-in server.")
+    parser.add_argument("--connections", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--extraction", choices=("script", "html", "fields"), default="script")
+    parser.add_argument("--backend", choices=("json", "sqlite"), default="sqlite")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the server adds to every request")
+    parser.add_argument("--http", action="store_true", help="Fetch the contact-info pages over HTTP")
+    parser.add_argument("--http-concurrency", type=int, default=8)
+    parser.add_argument("--js-rendered-every", type=int, default=0,
+                        help="Render every Nth contact-info page with JavaScript, so it needs the browser")
+    parser.add_argument("--save", action="store_true", help="Store the results as the baseline")
+    parser.add_argument("--compare", action="store_true", help="Fail if a case is slower than the baseline")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    results = {}
+    for connections in args.connections:
+        mode = f"http-{args.http_concurrency}" if args.http else args.extraction
+        case = f"{connections}-connections-{args.workers}-workers-{mode}-{args.backend}"
+        results[case] = run_case(connections, workers=args.workers, extraction=args.extraction,
+                                 backend=args.backend, latency=args.latency, http=args.http,
+                                 http_concurrency=args.http_concurrency, js_rendered_every=args.js_rendered_every)
+        print_case(case, results[case])
+
+    sys.exit(finish(SUITE, results, args.save, args.compare, args.tolerance))
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""
+Generator of realistic synthetic person records, in the format the scraper stores them.
+
+Titles mix languages, emojis and '|' separated skills, locations come in the different shapes LinkedIn
+shows (city/region/country, metropolitan areas, countries alone, empty) and contact fields are sparse.
+Every record is a deterministic function of its index and the seed.
+
+    python -m benchmarks.synthetic_data 100000 data_folder/synthetic_connections_links.json
+"""
+import argparse
+import json
+import random
+import re
+
+from unidecode import unidecode
+
+FIRST_NAMES = ["Lucía", "Hugo", "Martina", "Mateo", "María", "Leo", "Julia", "Pablo", "Emma", "Daniel",
+               "Chloé", "Lukas", "Giulia", "João", "Priya", "Wei", "Aisha", "Olivia", "Noah", "Sofía",
+               "Álvaro", "Irene", "Jesús", "Nuria", "Íñigo", "Zoë", "François", "Søren", "Björn", "Łukasz"]
+LAST_NAMES = ["García", "Martínez", "López", "Sánchez", "Pérez", "Gómez", "Müller", "Rossi", "Silva",
+              "Dubois", "Smith", "Kumar", "Chen", "Hernández", "Díaz", "Moreno", "Romero", "Navarro",
+              "Fernández", "Ruiz", "Jiménez", "Álvarez", "Schmidt", "Costa", "Nowak", "O'Brien"]
+ROLES = [
+    # Español
+    "Ingeniero de Software", "Ingeniera de Datos", "Desarrollador Full Stack", "Desarrolladora Backend",
+    "Analista de Datos", "Científica de Datos", "Responsable de RRHH", "Técnico de Selección",
+    "Consultor SAP FI/CO", "Diseñadora UX/UI", "Jefe de Proyecto", "Estudiante de Ingeniería Informática",
+    "Alumno en prácticas", "Profesora en la Universidad de Sevilla", "Abogado", "Enfermera",
+    "Director Financiero", "Especialista en Ciberseguridad", "Product Owner", "Marketing Digital y SEO",
+    # English
+    "Software Engineer", "Senior Data Scientist", "Machine Learning Engineer", "DevOps Engineer",
+    "Frontend Developer", "Product Manager", "Talent Acquisition Specialist", "CTO & Co-founder",
+    "Cloud Architect", "Security Analyst", "Sales Manager", "PhD Student", "Eng. Manager",
+    # Otros idiomas
+    "Engenheiro de Software", "Analista de Sistemas", "Ingénieur logiciel", "Chef de projet",
+    "Softwareentwickler", "Datenanalyst", "Sviluppatore Software",
+]
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Telefónica", "BBVA", "Inditex", "Indra", "Accenture",
+             "Santander", "Iberdrola", "Cabify", "Glovo", "Amazon", "Google", "Universidad Complutense"]
+COMPANY_PREFIXES = [" at ", " en ", " @ ", " - ", " chez ", " bei "]
+SKILLS = ["Python", "Java", "SQL", "Power BI", "AWS", "Azure", "Kubernetes", "Docker", "React", "Node.js",
+          "Machine Learning", "Deep Learning", "ETL", "Big Data", "SAP", "Scrum", "Agile", "SEO",
+          "Pentesting", "OSCP", "Figma", "Excel", "Pandas", "Spark", "Terraform", "C#", ".NET"]
+EMOJIS = ["🚀", "📊", "☁️", "✨", "💻", "🔥", "🌍", "👨‍💻", "👩‍🔬", "🎓", "⭐", "📈"]
+LOCATIONS = [
+    "Madrid, Comunidad de Madrid, España", "Barcelona, Cataluña, España", "Valencia, Comunidad Valenciana, España",
+    "Sevilla, Andalucía, España", "Málaga, Andalucía, España", "Bilbao, País Vasco, España",
+    "Zaragoza, Aragón, España", "A Coruña, Galicia, España", "Palma, Islas Baleares, España",
+    "Lisboa, Lisboa, Portugal", "Porto, Porto, Portugal", "London, England, United Kingdom",
+    "Berlin, Berlin, Germany", "Paris, Île-de-France, France", "Milano, Lombardia, Italia",
+    "Ciudad de México, Ciudad de México, México", "Buenos Aires, Buenos Aires, Argentina",
+    "Bogotá, Bogotá D.C., Colombia", "San Francisco, California, United States",
+    "Greater Madrid Metropolitan Area", "Área metropolitana de Barcelona", "España", "Remote", "",
+]
+
+
+def _slug(first: str, last: str) -> str:
+    return re.sub(r'[^a-z]', '', unidecode(f"{first}{last}").lower())
+
+
+def synthetic_title(rng: random.Random) -> str:
+    if rng.random() < 0.05:
+        return ""
+    title = rng.choice(ROLES)
+    if rng.random() < 0.5:
+        title += rng.choice(COMPANY_PREFIXES) + rng.choice(COMPANIES)
+    if rng.random() < 0.4:
+        title += " | " + " | ".join(rng.sample(SKILLS, rng.randint(1, 4)))
+    if rng.random() < 0.25:
+        emojis = "".join(rng.sample(EMOJIS, rng.randint(1, 2)))
+        title = f"{emojis} {title}" if rng.random() < 0.3 else f"{title} {emojis}"
+    return title
+
+
+def synthetic_person(index: int, seed: int = 0) -> dict:
+    """
+    Builds the synthetic person number 'index'.
+    :param index: Position of the person; also used in its profile URL and contact fields.
+    :param seed: Seed of the whole dataset.
+    :return: Dictionary with the fields Person.to_dict() returns.
+    """
+    rng = random.Random(seed * 1_000_003 + index)
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    slug = f"{_slug(first, last)}{index}"
+    return {
+        "profile": f"https://www.linkedin.com/in/{slug}/",
+        "name": f"{first} {last}",
+        "title": synthetic_title(rng),
+        "phone": f"+34 6{rng.randrange(10 ** 7, 10 ** 8)}" if rng.random() < 0.1 else "",
+        "email": f"{slug}@example.com" if rng.random() < 0.3 else "",
+        "address": f"Calle Mayor {rng.randint(1, 200)}, {rng.choice(LOCATIONS[:9]).split(',')[0]}" if rng.random() < 0.02 else "",
+        "birthday": f"{rng.randint(1, 28)} de {rng.choice(['enero', 'mayo', 'octubre'])}" if rng.random() < 0.1 else "",
+        "location": rng.choice(LOCATIONS),
+        "website": f"{slug}.dev" if rng.random() < 0.2 else "",
+        "photo": f"https://media.example.com/photos/{slug}.jpg" if rng.random() < 0.8 else "",
+    }
+
+
+def generate_persons(count: int, seed: int = 0):
+    """
+    Yields 'count' synthetic persons.
+    """
+    for index in range(count):
+        yield synthetic_person(index, seed)
+
+
+def write_connections_file(file_path, count: int, seed: int = 0) -> None:
+    """
+    Writes a connections file in the FileManager layout with 'count' scraped synthetic persons,
+    streaming the persons so large datasets do not need to fit in memory.
+    """
+    with open(file_path, "w", encoding='utf-8') as file:
+        file.write('{"connections": [], "scraped_texts": [')
+        file.write(", ".join(json.dumps(person["profile"]) for person in generate_persons(count, seed)))
+        file.write('], "persons": [')
+        for index, person in enumerate(generate_persons(count, seed)):
+            file.write((", " if index else "") + json.dumps(person, ensure_ascii=False))
+        file.write(']}')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Writes a connections file with synthetic persons.")
+    parser.add_argument("count", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_connections_file(args.output, args.count, args.seed)
+    print(f"{args.count} synthetic persons written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
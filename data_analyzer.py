@@ -1,6 +1,10 @@
+import copy
 import json
+from abc import ABC, abstractmethod
 from collections import Counter, defaultdict
 import re
+import sys
+import numpy as np
 import matplotlib.pyplot as plt
 import seaborn as sns
 import plotly.express as px
@@ -18,65 +22,283 @@ def load_cleaned_data(file_path):
         print(f"Error al cargar los datos limpios: {e}")
         return []
 
-def count_occurrences(data, key):
-    """Cuenta la frecuencia de valores en una clave específica."""
-    counts = Counter()
-    for person in data:
-        value = person.get(key)
+PROVINCE_MAPPING = {
+    "Madrid": "Madrid",
+    "Community of Madrid": "Madrid",
+    "Barcelona": "Barcelona",
+    "Catalonia": "Barcelona",
+}
+COMPLETION_KEYS = ("email", "phone", "website")
+
+
+def encode_categories(values):
+    """Codifica valores como enteros por orden de aparición; los valores vacíos se codifican como -1."""
+    labels = {}
+    codes = np.fromiter((labels.setdefault(value, len(labels)) if value else -1 for value in values),
+                        dtype=np.int64, count=len(values))
+    return codes, list(labels)
+
+
+class ColumnarDataset:
+    """
+    Datos limpios cargados una sola vez en columnas de NumPy para calcular las métricas vectorizadas.
+    Las columnas de 'cleaned_location' se llaman 'cleaned_location.<campo>'. Las claves sin columna
+    se calculan sobre la lista original, que se conserva en records.
+    """
+
+    def __init__(self, data, categorical_keys=("title_category",)):
+        """
+        :param data: Lista de personas limpias.
+        :param categorical_keys: Claves de primer nivel que se codifican como columnas categóricas.
+        """
+        self.records = data
+        self.size = len(data)
+        self.categorical_keys = tuple(categorical_keys)
+        locations = [person.get("cleaned_location", {}) for person in data]
+        self.categories = {
+            "cleaned_location.country": encode_categories([location.get("country") for location in locations]),
+            "cleaned_location.region": encode_categories([location.get("region") for location in locations]),
+        }
+        for key in categorical_keys:
+            self.categories[key] = encode_categories([person.get(key) for person in data])
+        self.masks = {key: np.fromiter((bool(person.get(key)) for person in data), dtype=bool, count=self.size)
+                      for key in COMPLETION_KEYS}
+        self.cleaned_titles = [person.get("cleaned_title", []) for person in data]
+
+    def __len__(self):
+        return self.size
+
+    def value_counts(self, column, mapping=None):
+        """Cuenta las apariciones de cada valor de una columna categórica, en orden de aparición."""
+        codes, labels = self.categories[column]
+        if mapping:
+            # Las etiquetas que se agrupan bajo un mismo nombre comparten código
+            names = {}
+            remap = np.array([names.setdefault(mapping.get(label, label), len(names)) for label in labels] or [0])
+            labels = list(names)
+            codes = np.where(codes >= 0, remap[np.maximum(codes, 0)], -1)
+        counts = np.bincount(codes[codes >= 0], minlength=len(labels))
+        return {label: int(count) for label, count in zip(labels, counts) if count}
+
+    def completion_count(self, key):
+        """Número de personas con un dato específico."""
+        return int(np.count_nonzero(self.masks[key]))
+
+
+def percentages(counts, total):
+    return {value: round((count / total) * 100, 2) for value, count in counts.items()}
+
+
+STOPWORDS = {"and", "of", "in", "on", "at", "to", "for", "with", "a", "an", "the", "de", "en", "y", "el", "la", "los", "las"}
+
+
+class Metric(ABC):
+    """
+    Métrica que se calcula igual de dos formas: acumulando persona a persona con update() y result(),
+    o de una vez sobre las columnas de un ColumnarDataset con compute().
+    """
+
+    @abstractmethod
+    def reset(self):
+        """Vacía lo acumulado."""
+
+    @abstractmethod
+    def update(self, person):
+        """Acumula una persona."""
+
+    @abstractmethod
+    def result(self, total):
+        """Devuelve el resultado de las personas acumuladas."""
+
+    @abstractmethod
+    def compute(self, dataset):
+        """Devuelve el resultado calculado sobre las columnas de un ColumnarDataset."""
+
+    def fresh(self):
+        """Copia de la métrica con la misma configuración y sin nada acumulado."""
+        metric = copy.copy(self)
+        metric.reset()
+        return metric
+
+    def compute_records(self, dataset):
+        """Calcula el resultado acumulando las personas del dataset, para los datos que no tienen columna."""
+        metric = self.fresh()
+        for person in dataset.records:
+            metric.update(person)
+        return metric.result(len(dataset))
+
+
+class OccurrencesMetric(Metric):
+    """Frecuencia de los valores de una clave (los diccionarios y listas cuentan cada valor)."""
+
+    def __init__(self, key):
+        self.key = key
+        self.reset()
+
+    def reset(self):
+        self.counts = Counter()
+
+    def update(self, person):
+        value = person.get(self.key)
         if isinstance(value, dict):
-            counts.update(value.values())
+            self.counts.update(value.values())
         elif isinstance(value, list):
-            counts.update(value)
+            self.counts.update(value)
         elif value:
-            counts[value] += 1
-    return counts
+            self.counts[value] += 1
+
+    def result(self, total):
+        return self.counts
+
+    def compute(self, dataset):
+        if self.key in dataset.categorical_keys:
+            return Counter(dataset.value_counts(self.key))
+        return self.compute_records(dataset)
+
+
+class LocationPercentageMetric(Metric):
+    """Porcentaje de personas por un campo de 'cleaned_location', agrupando valores con un mapeo opcional."""
+
+    def __init__(self, field, mapping=None):
+        self.field = field
+        self.mapping = mapping or {}
+        self.reset()
+
+    def reset(self):
+        self.counts = defaultdict(int)
+
+    def update(self, person):
+        value = person.get("cleaned_location", {}).get(self.field)
+        if value:
+            self.counts[self.mapping.get(value, value)] += 1
+
+    def result(self, total):
+        return percentages(self.counts, total)
+
+    def compute(self, dataset):
+        column = f"cleaned_location.{self.field}"
+        if column not in dataset.categories:
+            return self.compute_records(dataset)
+        return percentages(dataset.value_counts(column, self.mapping), len(dataset))
+
+
+class CompletionMetric(Metric):
+    """Porcentaje de personas que tienen un dato específico."""
+
+    def __init__(self, key):
+        self.key = key
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+
+    def update(self, person):
+        if person.get(self.key):
+            self.count += 1
+
+    def result(self, total):
+        if total == 0:
+            return 0
+        return round((self.count / total) * 100, 2)
+
+    def compute(self, dataset):
+        if self.key not in dataset.masks:
+            return self.compute_records(dataset)
+        total = len(dataset)
+        return round((dataset.completion_count(self.key) / total) * 100, 2) if total else 0
+
+
+class TitleKeywordsMetric(Metric):
+    """Palabras clave más frecuentes en los títulos limpios, sin palabras vacías."""
+
+    def __init__(self, top_n=10):
+        self.top_n = top_n
+        self.reset()
+
+    def reset(self):
+        self.counts = Counter()
+
+    def update(self, person):
+        self._count(person.get("cleaned_title", []))
+
+    def _count(self, titles):
+        for title in titles:
+            self.counts.update(re.findall(r'\b\w+\b', title.lower()))
+
+    def result(self, total):
+        filtered_keywords = {word: count for word, count in self.counts.items() if word not in STOPWORDS}
+        return Counter(filtered_keywords).most_common(self.top_n)
+
+    def compute(self, dataset):
+        metric = self.fresh()
+        for titles in dataset.cleaned_titles:
+            metric._count(titles)
+        return metric.result(len(dataset))
+
+
+class Aggregator:
+    """
+    Calcula todas las métricas registradas: sobre las columnas si recibe un ColumnarDataset, o con una
+    sola pasada si recibe un iterable de personas. Las métricas registradas no acumulan nada: cada
+    ejecución trabaja sobre copias vacías, así que run() puede llamarse varias veces.
+    """
+
+    def __init__(self):
+        self.metrics = {}
+
+    def register(self, name, metric):
+        """Registra una métrica con un nombre; devuelve el propio agregador para encadenar llamadas."""
+        self.metrics[name] = metric
+        return self
+
+    def run(self, persons):
+        """Devuelve un diccionario nombre -> resultado."""
+        if isinstance(persons, ColumnarDataset):
+            return {name: metric.compute(persons) for name, metric in self.metrics.items()}
+        metrics = {name: metric.fresh() for name, metric in self.metrics.items()}
+        total = 0
+        for person in persons:
+            total += 1
+            for metric in metrics.values():
+                metric.update(person)
+        return {name: metric.result(total) for name, metric in metrics.items()}
+
+
+def default_aggregator(top_n=10):
+    """Agregador con los análisis que muestra el script."""
+    aggregator = Aggregator()
+    aggregator.register("provinces", LocationPercentageMetric("region", PROVINCE_MAPPING))
+    aggregator.register("countries", LocationPercentageMetric("country"))
+    for key in COMPLETION_KEYS:
+        aggregator.register(key, CompletionMetric(key))
+    aggregator.register("title_keywords", TitleKeywordsMetric(top_n))
+    return aggregator
+
+
+def run_metric(data, metric):
+    """Calcula una métrica sobre una lista de personas o un ColumnarDataset."""
+    return Aggregator().register("result", metric).run(data)["result"]
+
+
+def count_occurrences(data, key):
+    """Cuenta la frecuencia de valores en una clave específica."""
+    return run_metric(data, OccurrencesMetric(key))
 
 def analyze_most_frequent_titles(data, top_n=10):
     """Identifica las palabras clave más frecuentes en los títulos."""
-    keyword_counts = Counter()
-    for person in data:
-        titles = person.get("cleaned_title", [])
-        for title in titles:
-            words = re.findall(r'\b\w+\b', title.lower())
-            keyword_counts.update(words)
-    stopwords = {"and", "of", "in", "on", "at", "to", "for", "with", "a", "an", "the", "de", "en", "y", "el", "la", "los", "las"}
-    filtered_keywords = {word: count for word, count in keyword_counts.items() if word not in stopwords}
-    return Counter(filtered_keywords).most_common(top_n)
+    return run_metric(data, TitleKeywordsMetric(top_n))
 
 def analyze_province_distribution(data):
     """Analiza la distribución por provincias (España) y regiones (resto del mundo)."""
-    province_mapping = {
-        "Madrid": "Madrid",
-        "Community of Madrid": "Madrid",
-        "Barcelona": "Barcelona",
-        "Catalonia": "Barcelona",
-    }
-    province_counts = defaultdict(int)
-    for person in data:
-        location = person.get("cleaned_location", {}).get("region")
-        if location:
-            province = province_mapping.get(location, location)
-            province_counts[province] += 1
-    total = len(data)
-    return {province: round((count / total) * 100, 2) for province, count in province_counts.items()}
+    return run_metric(data, LocationPercentageMetric("region", PROVINCE_MAPPING))
 
 def analyze_country_percentage(data):
     """Calcula el porcentaje de personas por país."""
-    country_counts = Counter()
-    for person in data:
-        location = person.get("cleaned_location", {}).get("country")
-        if location:
-            country_counts[location] += 1
-    total = len(data)
-    return {country: round((count / total) * 100, 2) for country, count in country_counts.items()}
+    return run_metric(data, LocationPercentageMetric("country"))
 
 def calculate_completion_percentage(data, key):
     """Calcula el porcentaje de personas que tienen un dato específico."""
-    total = len(data)
-    if total == 0:
-        return 0
-    count = sum(1 for person in data if person.get(key))
-    return round((count / total) * 100, 2)
+    return run_metric(data, CompletionMetric(key))
 
 def plot_province_distribution(province_distribution):
     """Crea un gráfico de barras para la distribución por provincias o regiones."""
@@ -112,39 +334,79 @@ def plot_completion_percentage(email_percentage, phone_percentage, website_perce
     plt.ylim(0, 100)
     plt.show()
 
-def main():
-    file_path = "data_folder/cleaned_connections_links.json"
+def summary_results(summary, top_n=10):
+    """Convierte el resumen mantenido durante el scraping en los mismos resultados que default_aggregator()."""
+    total = summary["total"]
+    provinces = defaultdict(int)
+    for region, count in summary["regions"].items():
+        provinces[PROVINCE_MAPPING.get(region, region)] += count
+    keywords = Counter({word: count for word, count in summary["title_keywords"].items() if word not in STOPWORDS})
+    results = {
+        "provinces": percentages(provinces, total),
+        "countries": percentages(summary["countries"], total),
+        "title_keywords": keywords.most_common(top_n),
+    }
+    for key in COMPLETION_KEYS:
+        results[key] = round((summary["completion"][key] / total) * 100, 2) if total else 0
+    return results
 
-    data = load_cleaned_data(file_path)
-    if not data:
-        print("El archivo JSON no contiene datos válidos.")
-        return
 
-    print(len(data))
-    
+def print_results(results):
     # Análisis por provincias/regiones
-    province_distribution = analyze_province_distribution(data)
+    province_distribution = results["provinces"]
     print("\nDistribución por provincias o regiones (%):")
     for province, percentage in province_distribution.items():
         print(f"{province}: {percentage}%")
     #plot_province_distribution(province_distribution)
 
     # Porcentaje por países
-    country_percentage = analyze_country_percentage(data)
+    country_percentage = results["countries"]
     print("\nPorcentaje de personas por país:")
     for country, percentage in country_percentage.items():
         print(f"{country}: {percentage}%")
     #plot_country_percentage(country_percentage)
 
     # Porcentaje de datos completados
-    email_percentage = calculate_completion_percentage(data, "email")
-    phone_percentage = calculate_completion_percentage(data, "phone")
-    website_percentage = calculate_completion_percentage(data, "website")
+    email_percentage = results["email"]
+    phone_percentage = results["phone"]
+    website_percentage = results["website"]
     print("\nPorcentaje de datos completados:")
     print(f"Correo electrónico: {email_percentage}%")
     print(f"Teléfono: {phone_percentage}%")
     print(f"Website: {website_percentage}%")
     #plot_completion_percentage(email_percentage, phone_percentage, website_percentage)
 
+    # Palabras clave más frecuentes en los títulos
+    print("\nPalabras clave más frecuentes en los títulos:")
+    for keyword, count in results["title_keywords"]:
+        print(f"{keyword}: {count}")
+
+
+def main():
+    # Con --live se muestran las estadísticas que el scraper mantiene mientras guarda cada persona
+    if "--live" in sys.argv[1:]:
+        summary_path = "data_folder/connections_links.summary.json"
+        try:
+            with open(summary_path, "r", encoding="utf-8") as file:
+                summary = json.load(file)
+        except Exception as e:
+            print(f"Error al cargar el resumen: {e}")
+            return
+        print(summary["total"])
+        print_results(summary_results(summary))
+        return
+
+    file_path = "data_folder/cleaned_connections_links.json"
+
+    data = load_cleaned_data(file_path)
+    if not data:
+        print("El archivo JSON no contiene datos válidos.")
+        return
+
+    print(len(data))
+
+    # Los datos se cargan una sola vez en columnas y todos los análisis se calculan sobre ellas
+    print_results(default_aggregator().run(ColumnarDataset(data)))
+
 if __name__ == "__main__":
     main()
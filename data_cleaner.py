@@ -1,7 +1,31 @@
+import hashlib
 import json
-import re
+import os
+import textwrap
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from unidecode import unidecode
-from geopy.geocoders import Nominatim
+
+from src.normalization import (TITLE_CATEGORIES, TITLE_SYNONYMS, TitleClassifier, TitleNormalizer, classify_title,
+                               clean_location, clean_title, extract_keywords, get_title_normalizer,
+                               remove_emojis_and_symbols)
+
+# La normalización de títulos y ubicaciones vive en src.normalization; se reexporta aquí para no romper
+# a quien la importaba desde data_cleaner
+__all__ = [
+    "TITLE_CATEGORIES", "TITLE_SYNONYMS", "TitleClassifier", "TitleNormalizer", "classify_title", "clean_location",
+    "clean_title", "extract_keywords", "get_title_normalizer", "remove_emojis_and_symbols",
+    "GEOCODE_CACHE_PATH", "GEOCODE_CACHE_TTL", "CLEANER_VERSION", "load_data", "JsonStreamReader", "iter_persons",
+    "normalize_location", "default_geocoder", "GeocodingCache", "geocode_location", "normalize_text",
+    "clean_person", "clean_persons", "add_coordinates", "process_data", "chunked", "record_hash", "CleanedIndex",
+    "is_geocode_miss", "process_stream", "assemble_json",
+]
+
+GEOCODE_CACHE_PATH = "data_folder/geocode_cache.json"
+GEOCODE_CACHE_TTL = 90 * 24 * 3600  # Segundos que se reutiliza una geocodificación (también los fallos)
+CLEANER_VERSION = 1  # Incrementar al cambiar la limpieza para que se vuelvan a limpiar todos los registros
 
 
 def load_data(file_path):
@@ -18,178 +42,199 @@ def load_data(file_path):
         return []
 
 
-def clean_location(location):
-    """Limpia el campo 'location' separando las tres partes de la ubicación."""
-    if location:
-        parts = location.split(", ")  # Separa por comas
-        return {
-            "city": parts[0] if len(parts) > 0 else None,
-            "region": parts[1] if len(parts) > 1 else None,
-            "country": parts[2] if len(parts) > 2 else None,
-        }
-    return {"city": None, "region": None, "country": None}
-
+class JsonStreamReader:
+    """Lee un archivo JSON por bloques y decodifica sus valores uno a uno."""
+
+    def __init__(self, file, block_size=1 << 16):
+        self.file = file
+        self.block_size = block_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.position = 0
+        self.eof = False
+
+    def _fill(self):
+        block = self.file.read(self.block_size)
+        if not block:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + block
+        self.position = 0
+        return True
+
+    def peek(self):
+        """Devuelve el siguiente carácter que no sea un espacio, sin consumirlo."""
+        while True:
+            while self.position < len(self.buffer) and self.buffer[self.position] in " \t\r\n":
+                self.position += 1
+            if self.position < len(self.buffer) or not self._fill():
+                return self.buffer[self.position] if self.position < len(self.buffer) else ""
+
+    def expect(self, character):
+        if self.peek() != character:
+            raise ValueError(f"JSON inválido: se esperaba '{character}' en la posición {self.position}.")
+        self.position += 1
+
+    def decode(self):
+        """Decodifica el siguiente valor completo."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+                # Un número al final del bloque podría continuar en el siguiente
+                if end < len(self.buffer) or self.eof:
+                    self.position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+    def iter_array(self):
+        """Decodifica uno a uno los elementos del array que empieza en la posición actual."""
+        self.expect("[")
+        if self.peek() == "]":
+            self.position += 1
+            return
+        while True:
+            yield self.decode()
+            if self.peek() == ",":
+                self.position += 1
+            else:
+                self.expect("]")
+                return
+
+
+def iter_persons(file_path, key="persons"):
+    """Lee las personas de un archivo JSON (o JSON Lines) una a una, sin cargar el archivo completo."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        if str(file_path).endswith(".jsonl"):
+            for line in file:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        reader = JsonStreamReader(file)
+        reader.expect("{")
+        while reader.peek() not in ("}", ""):
+            name = reader.decode()
+            reader.expect(":")
+            if reader.peek() == "[":
+                for value in reader.iter_array():
+                    if name == key:
+                        yield value
+            else:
+                reader.decode()
+            if reader.peek() == ",":
+                reader.position += 1
 
-def geocode_location(location):
-    """Obtiene coordenadas de una ubicación utilizando geopy."""
-    geolocator = Nominatim(user_agent="location_cleaner")
-    try:
-        if location:
-            geo_data = geolocator.geocode(location)
-            if geo_data:
-                return {"latitude": geo_data.latitude, "longitude": geo_data.longitude}
-    except Exception as e:
-        print(f"Error en la geocodificación: {e}")
-    return {"latitude": None, "longitude": None}
 
+def normalize_location(location):
+    """Normaliza una ubicación (sin tildes, minúsculas y espacios simples) para usarla como clave."""
+    if location:
+        return " ".join(unidecode(location).casefold().split())
+    return ""
 
-def remove_emojis_and_symbols(text):
-    """Elimina emoticonos y símbolos especiales de un texto."""
-    if text:
-        return re.sub(r'[\U00010000-\U0010FFFF]|[\*#@&<>\\/|]', '', text)
-    return text
 
+def default_geocoder():
+    """Crea el geocodificador de Nominatim limitado a una petición por segundo."""
+    from geopy.extra.rate_limiter import RateLimiter
+    from geopy.geocoders import Nominatim
 
-def clean_title(title, language="es"):
-    """Limpia y procesa el campo 'title' gestionando separadores, sinónimos y idioma."""
-    if title:
-        title = remove_emojis_and_symbols(title)
-
-        # Dividir por el separador | si existe
-        parts = [t.strip() for t in title.split("|")]
-
-        synonyms = {
-            "es": {
-                "Estudiante": ["Alumno", "Aprendiz"],
-                "Universidad": ["Uni", "Facultad"],
-                "Ingeniero": ["Engineer", "Eng."],
-                "Desarrollador": ["Developer", "Dev"]
-            },
-            "en": {
-                "Student": ["Learner", "Pupil"],
-                "University": ["College", "Faculty"],
-                "Engineer": ["Ingeniero", "Eng."],
-                "Developer": ["Desarrollador", "Dev"]
+    geolocator = Nominatim(user_agent="location_cleaner")
+    return RateLimiter(geolocator.geocode, min_delay_seconds=1, swallow_exceptions=False)
+
+
+class GeocodingCache:
+    """Geocodifica ubicaciones únicas y guarda los resultados (incluidos los fallos) en una caché en disco."""
+
+    def __init__(self, cache_path=GEOCODE_CACHE_PATH, ttl=GEOCODE_CACHE_TTL, geocoder=None, save_every=25):
+        """
+        :param cache_path: Ruta del archivo JSON de la caché; None para no persistirla.
+        :param ttl: Segundos durante los que una entrada de la caché es válida.
+        :param geocoder: Función que recibe una ubicación y devuelve un objeto con latitude/longitude o None.
+                         Por defecto se usa Nominatim.
+        :param save_every: Número de consultas nuevas tras las que se guarda la caché.
+        """
+        self.cache_path = cache_path
+        self.ttl = ttl
+        self._geocoder = geocoder
+        self.save_every = save_every
+        self.entries = self._load()
+        self.lookups = 0
+        self._unsaved = 0
+
+    @property
+    def geocoder(self):
+        if self._geocoder is None:
+            self._geocoder = default_geocoder()
+        return self._geocoder
+
+    def _load(self):
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError) as e:
+            print(f"Error al cargar la caché de geocodificación: {e}")
+            return {}
+
+    def save(self):
+        """Guarda la caché en disco."""
+        if not self.cache_path or not self._unsaved:
+            return
+        with open(self.cache_path, "w", encoding="utf-8") as file:
+            json.dump(self.entries, file, ensure_ascii=False)
+        self._unsaved = 0
+
+    def _is_fresh(self, entry):
+        return time.time() - entry["timestamp"] < self.ttl
+
+    def lookup(self, location):
+        """Devuelve las coordenadas de una ubicación, consultando el geocodificador solo si no está en caché."""
+        key = normalize_location(location)
+        if not key:
+            return {"latitude": None, "longitude": None}
+
+        entry = self.entries.get(key)
+        if entry is None or not self._is_fresh(entry):
+            try:
+                geo_data = self.geocoder(location)
+            except Exception as e:
+                print(f"Error en la geocodificación: {e}")
+                return {"latitude": None, "longitude": None}
+            self.lookups += 1
+            entry = {
+                "latitude": geo_data.latitude if geo_data else None,
+                "longitude": geo_data.longitude if geo_data else None,
+                "timestamp": time.time(),
             }
-        }
-
-        def replace_synonyms(text):
-            for key, values in synonyms.get(language, {}).items():
-                for value in values:
-                    text = re.sub(rf"\b{value}\b", key, text, flags=re.IGNORECASE)
-            return text
-
-        cleaned_parts = [replace_synonyms(part) for part in parts]
-        return cleaned_parts
-    return []
-
-
-def extract_keywords(title):
-    """Extrae palabras clave de un título."""
-    if title:
-        keywords = re.findall(r"\b[A-Za-z0-9]+\b", title)
-        return list(set(keywords))  # Elimina duplicados
-    return []
-
-
-def classify_title(title):
-    """Clasifica el título en categorías predefinidas."""
-    categories = {
-        "Data Science": [
-            "Data", "Machine Learning", "ETL", "Power BI", "Analytics", "Pandas", "AI", "Deep Learning", 
-            "Big Data", "Analista de Datos", "Ciencia de Datos", "Inteligencia Artificial", "Análisis Predictivo"
-        ],
-        "Engineering": [
-            "Engineer", "Desarrollador", "Developer", "Backend", "Frontend", "Software", "Fullstack", 
-            "Cloud", "Arquitecto de Software", "Ingeniero", "DevOps", "Cloud Engineer"
-        ],
-        "Programming Languages": [
-            "Python", "JavaScript", "Java", "C#", "C++", "Ruby", "PHP", "Go", "Swift", "Kotlin", 
-            "TypeScript", "SQL", "Perl", "Rust", "Matlab", "Scala", "Lenguajes de Programación", 
-            "Desarrollador Python", "Programador Java"
-        ],
-        "Cybersecurity": [
-            "Cybersecurity", "Pentesting", "SOC", "Blue Team", "Red Team", "Incident Response", 
-            "Threat", "SIEM", "MITRE", "Ciberseguridad", "Seguridad Informática", "Analista de Seguridad", 
-            "Hacking Ético", "Ethical Hacking", "Auditor de Seguridad"
-        ],
-        "Marketing": [
-            "SEO", "Marketing", "Content", "Social Media", "Growth", "Advertising", "Brand", 
-            "Digital", "Publicidad", "Mercadeo", "Estrategia de Marca", "Marketing Digital"
-        ],
-        "Operations": [
-            "Operations", "Supply Chain", "Logistics", "Project Management", "Process Improvement", 
-            "Operaciones", "Cadena de Suministro", "Logística", "Gestión de Proyectos", "Mejora de Procesos"
-        ],
-        "Human Resources": [
-            "HR", "Talent", "Recruitment", "People", "Payroll", "Employee", "Recursos Humanos", 
-            "Gestión de Talento", "Selección", "Gestión de Personas"
-        ],
-        "Finance": [
-            "Finance", "Financial", "Accounting", "Auditor", "Investment", "Banking", "Treasury", 
-            "Finanzas", "Contabilidad", "Auditoría", "Inversiones", "Banca", "Asesor Financiero"
-        ],
-        "Education": [
-            "Teacher", "Professor", "Educator", "Trainer", "Learning", "Instructor", "Docente", 
-            "Profesor", "Educador", "Formador", "Tutor", "Catedrático", "Maestro", "Coach Educativo", 
-            "Pedagogo", "Capacitación", "Entrenador de Habilidades"
-        ],
-        "Health": [
-            "Healthcare", "Doctor", "Nurse", "Therapist", "Pharmacist", "Medical", "Salud", 
-            "Médico", "Enfermero", "Terapeuta", "Farmacéutico", "Psiquiatra", "Fisioterapeuta"
-        ],
-        "Legal": [
-            "Lawyer", "Attorney", "Legal", "Compliance", "Contract", "Abogado", "Jurídico", 
-            "Cumplimiento", "Contrato", "Consultor Legal"
-        ],
-        "Creative": [
-            "Designer", "Illustrator", "Photographer", "Videographer", "Art", "Creative", 
-            "Diseñador", "Ilustrador", "Fotógrafo", "Videógrafo", "Arte", "Creativo", "Animador 3D", 
-            "Diseñador UI/UX"
-        ],
-        "Sales": [
-            "Sales", "Business Development", "Account Manager", "Customer", "Lead Generation", 
-            "Ventas", "Desarrollo de Negocios", "Gestión de Cuentas", "Representante de Ventas"
-        ],
-        "IT Support": [
-            "IT Support", "Helpdesk", "Service Desk", "Technical Support", "System Admin", 
-            "Soporte IT", "Informatico", "Administrador de Sistemas", "Soporte Técnico"
-        ],
-        "Manufacturing": [
-            "Production", "Manufacturing", "Factory", "Operations", "Quality Control", 
-            "Producción", "Fábrica", "Operaciones", "Control de Calidad", "Gestión de Producción"
-        ],
-        "Consulting": [
-            "Consultant", "Advisory", "Strategy", "Business Analysis", "Consultoría", 
-            "Estrategia", "Análisis de Negocios", "Asesor"
-        ],
-        "Freelance/Independent": [
-            "Freelance", "Self-employed", "Independent", "Autónomo", "Independiente", 
-            "Consultor Independiente"
-        ],
-        "Customer Service": [
-            "Customer Service", "Support Specialist", "Atención al Cliente", 
-            "Especialista en Soporte", "Soporte al Cliente"
-        ],
-        "Public Sector": [
-            "Public Sector", "Government", "Nonprofit", "Sector Público", 
-            "Gobierno", "Organización sin Fines de Lucro", "ONG"
-        ],
-        "Entrepreneurship": [
-            "Entrepreneur", "Startup", "Founder", "Co-Founder", "Emprendimiento", 
-            "Empresario", "Startup", "Fundador"
-        ],
-        "Agriculture": [
-            "Agriculture", "Farming", "Agronomist", "Agricultura", "Granja", "Agrónomo"
-        ],
-        "Other": [] 
-    }
-
-    if title:
-        for category, keywords in categories.items():
-            if any(keyword.lower() in title.lower() for keyword in keywords):
-                return category
-    return "Other"
+            self.entries[key] = entry
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self.save()
+
+        return {"latitude": entry["latitude"], "longitude": entry["longitude"]}
+
+    def geocode_many(self, locations):
+        """Geocodifica una lista de ubicaciones consultando una sola vez cada ubicación única."""
+        unique = {}
+        for location in locations:
+            key = normalize_location(location)
+            if key and key not in unique:
+                unique[key] = location
+        results = {key: self.lookup(location) for key, location in unique.items()}
+        self.save()
+        return results
+
+
+def geocode_location(location, cache=None):
+    """Obtiene coordenadas de una ubicación utilizando geopy."""
+    cache = cache or GeocodingCache()
+    coordinates = cache.lookup(location)
+    cache.save()
+    return coordinates
 
 
 def normalize_text(text):
@@ -199,40 +244,202 @@ def normalize_text(text):
     return text
 
 
-def process_data(data, language="es"):
-    """Procesa y limpia los datos cargados."""
-    for person in data:
+def clean_person(person, language="es"):
+    """Aplica a una persona las etapas de limpieza que no necesitan red."""
+    person["cleaned_location"] = clean_location(person.get("location"))
+
+    person["cleaned_title"] = clean_title(person.get("title"), language=language)
+
+    person["title_category"] = classify_title(person.get("title"))
 
-        person["cleaned_location"] = clean_location(person.get("location"))
+    person["title_keywords"] = extract_keywords(person.get("title"))
 
-        # Agregar coordenadas a la ubicación
-        geo_data = geocode_location(person.get("location"))
-        person["location_coordinates"] = geo_data
+    return person
 
-        person["cleaned_title"] = clean_title(person.get("title"), language=language)
 
-        person["title_category"] = classify_title(person.get("title"))
+def clean_persons(persons, language="es"):
+    """Limpia un bloque de personas (se ejecuta en los procesos del pool)."""
+    return [clean_person(person, language) for person in persons]
 
-        person["title_keywords"] = extract_keywords(person.get("title"))
 
-    return data
+def add_coordinates(persons, geocoding_cache):
+    """Agrega las coordenadas de la ubicación, geocodificando una sola vez cada ubicación distinta."""
+    coordinates = geocoding_cache.geocode_many(person.get("location") for person in persons)
+    for person in persons:
+        person["location_coordinates"] = dict(coordinates.get(
+            normalize_location(person.get("location")), {"latitude": None, "longitude": None}))
+    return persons
+
+
+def process_data(data, language="es", geocoding_cache=None):
+    """Procesa y limpia los datos cargados."""
+    for person in data:
+        clean_person(person, language)
+
+    # Agregar coordenadas a la ubicación
+    return add_coordinates(data, geocoding_cache or GeocodingCache())
+
+
+def chunked(iterable, size):
+    """Agrupa un iterable en listas de como máximo size elementos."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def record_hash(person, language="es"):
+    """Calcula el hash del contenido de una persona sin limpiar (y de la versión de la limpieza)."""
+    content = json.dumps([CLEANER_VERSION, language, person], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+class CleanedIndex:
+    """Índice profile -> (hash, posición) de una salida JSON Lines anterior, para reutilizar sus registros."""
+
+    def __init__(self, jsonl_path):
+        self.entries = {}
+        self.file = None
+        if jsonl_path and os.path.exists(jsonl_path):
+            self.file = open(jsonl_path, "rb")
+            offset = 0
+            for line in self.file:
+                if line.strip():
+                    record = json.loads(line)
+                    self.entries[record.get("profile")] = (record.get("source_hash"), offset)
+                offset += len(line)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, profile, source_hash):
+        """Devuelve el registro limpio anterior si su origen no ha cambiado, o None."""
+        entry = self.entries.get(profile)
+        if entry is None or entry[0] != source_hash:
+            return None
+        self.file.seek(entry[1])
+        return json.loads(self.file.readline())
+
+    def close(self):
+        if self.file:
+            self.file.close()
+
+
+def is_geocode_miss(record):
+    """Indica si un registro limpio tiene ubicación pero no obtuvo coordenadas."""
+    coordinates = record.get("location_coordinates") or {}
+    return bool(normalize_location(record.get("location"))) and coordinates.get("latitude") is None
+
+
+def process_stream(persons, output_path, language="es", geocoding_cache=None, processes=None, chunk_size=500):
+    """
+    Limpia las personas en bloques repartidos entre un pool de procesos y escribe cada resultado en
+    formato JSON Lines en cuanto está listo, conservando el orden de entrada. Solo se mantienen en
+    memoria los bloques en curso.
+    Cada registro guarda el hash de su origen (source_hash): si output_path ya existe, las personas
+    que no han cambiado se copian de la salida anterior y solo se limpian las nuevas o modificadas
+    (y las que no obtuvieron coordenadas, para volver a geocodificarlas).
+    Las personas que ya no están en el origen desaparecen de la salida.
+    :param persons: Iterable de personas, por ejemplo iter_persons(file_path).
+    :param output_path: Ruta del archivo JSON Lines de salida.
+    :param processes: Número de procesos; por defecto, uno por núcleo.
+    :param chunk_size: Número de personas por bloque.
+    :return: Diccionario con el número de personas escritas, limpiadas, reutilizadas y eliminadas.
+    """
+    geocoding_cache = geocoding_cache or GeocodingCache()
+    processes = processes or os.cpu_count() or 1
+    stats = {"written": 0, "cleaned": 0, "reused": 0, "dropped": 0}
+    previous = CleanedIndex(output_path)
+    temporary_path = f"{output_path}.tmp"
+    # Perfiles de la salida anterior que siguen en el origen (un perfil duplicado cuenta una sola vez)
+    matched = set()
+
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor, \
+                open(temporary_path, "w", encoding="utf-8") as output:
+            pending = deque()
+
+            def write_next():
+                slots, future = pending.popleft()
+                # La geocodificación (limitada por red) se hace aquí mientras el pool limpia los siguientes bloques
+                cleaned = iter(add_coordinates(future.result(), geocoding_cache) if future else [])
+                for source_hash, record in slots:
+                    if record is None:
+                        record = next(cleaned)
+                        record["source_hash"] = source_hash
+                        stats["cleaned"] += 1
+                    else:
+                        stats["reused"] += 1
+                    output.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    stats["written"] += 1
+
+            for chunk in chunked(persons, chunk_size):
+                slots = []
+                changed = []
+                for person in chunk:
+                    source_hash = record_hash(person, language)
+                    profile = person.get("profile")
+                    if profile in previous.entries:
+                        matched.add(profile)
+                    record = previous.get(profile, source_hash)
+                    # Los fallos de geocodificación no se reutilizan: se vuelven a consultar a la caché,
+                    # que decide con su TTL si hay que repetir la consulta
+                    if record is not None and is_geocode_miss(record):
+                        record = None
+                    slots.append((source_hash, record))
+                    if record is None:
+                        changed.append(person)
+                future = executor.submit(clean_persons, changed, language) if changed else None
+                pending.append((slots, future))
+                if len(pending) >= processes * 2:
+                    write_next()
+            while pending:
+                write_next()
+    finally:
+        previous.close()
+
+    os.replace(temporary_path, output_path)
+    stats["dropped"] = len(previous) - len(matched)
+    return stats
+
+
+def assemble_json(jsonl_path, output_path):
+    """Convierte un archivo JSON Lines de personas en el formato {"persons": [...]} línea a línea."""
+    with open(jsonl_path, "r", encoding="utf-8") as source, open(output_path, "w", encoding="utf-8") as output:
+        output.write('{\n    "persons": [')
+        separator = "\n"
+        empty = True
+        for line in source:
+            if not line.strip():
+                continue
+            person = json.dumps(json.loads(line), ensure_ascii=False, indent=4)
+            output.write(separator + textwrap.indent(person, " " * 8))
+            separator = ",\n"
+            empty = False
+        output.write("]\n}" if empty else "\n    ]\n}")
 
 
 def main():
     file_path = "data_folder/connections_links.json"
+    jsonl_path = "data_folder/cleaned_connections_links.jsonl"
+    output_path = "data_folder/cleaned_connections_links.json"
 
-    data = load_data(file_path)
-    if not data:
+    try:
+        # Las salidas anteriores sin archivo JSON Lines se convierten para poder reutilizar sus registros
+        if not os.path.exists(jsonl_path) and os.path.exists(output_path):
+            with open(jsonl_path, "w", encoding="utf-8") as file:
+                for person in iter_persons(output_path):
+                    file.write(json.dumps(person, ensure_ascii=False) + "\n")
+        stats = process_stream(iter_persons(file_path), jsonl_path)
+    except Exception as e:
+        print(f"Error al limpiar los datos: {e}")
+        return
+    if not stats["written"]:
         print("El archivo JSON no contiene datos válidos.")
         return
+    print(f"{stats['cleaned']} personas limpiadas, {stats['reused']} sin cambios y {stats['dropped']} eliminadas.")
 
-    cleaned_data = process_data(data)
-
-    # Opcional: Guardar los datos procesados en un archivo nuevo
-    output_path = "data_folder/cleaned_connections_links.json"
     try:
-        with open(output_path, "w", encoding="utf-8") as file:
-            json.dump({"persons": cleaned_data}, file, ensure_ascii=False, indent=4)
+        assemble_json(jsonl_path, output_path)
         print(f"Datos limpios guardados en {output_path}")
     except Exception as e:
         print(f"Error al guardar los datos limpios: {e}")
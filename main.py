@@ -1,41 +1,101 @@
 from src.ConfigManager import ConfigValidator, FileManager
 from src.linkedIn_authenticator import LinkedInAuthenticator
 from src.linkedIn_conector import LinkedInConector
+from src.browserPool import BrowserPool
+from src.httpFetcher import HttpContactFetcher
+from src.leanProfile import apply_lean_profile
+from src.pageWait import PageWaiter
+from src.rateScheduler import RateLimitError, RateScheduler, SessionExpiredError
 from src.utils import chromeBrowserOptions, printred, printyellow
+from src.warmBrowser import attached_browser_options, is_debugger_listening, resolve_driver_path, serve_browser
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.common.exceptions import WebDriverException, TimeoutException
 
 from pathlib import Path
+import sys
 
-def init_browser() -> webdriver.Chrome:
+def init_browser(use_profile: bool = True, lean: bool = False, debugger_address: str = None) -> webdriver.Chrome:
     try:
-        options = chromeBrowserOptions()
-        service = ChromeService(ChromeDriverManager().install())
-        return webdriver.Chrome(service=service, options=options)
+        if debugger_address:
+            options = attached_browser_options(debugger_address, lean=lean)
+        else:
+            options = chromeBrowserOptions(use_profile=use_profile, lean=lean)
+        service = ChromeService(resolve_driver_path())
+        browser = webdriver.Chrome(service=service, options=options)
+        if lean:
+            apply_lean_profile(browser)
+        return browser
     except Exception as e:
         raise RuntimeError(f"Failed to initialize browser: {str(e)}")
 
 def main():
     browser = None
+    conector = None
+    auth = None
+    attached = False
     try:
         data_folder = Path("data_folder")
+        if "--refresh-driver" in sys.argv[1:]:
+            printyellow(f"ChromeDriver cached at {resolve_driver_path(refresh=True)}")
+            return
+
+        settings = ConfigValidator.validate_settings(data_folder / 'settings.yaml')
+        if "--serve-browser" in sys.argv[1:]:
+            if not settings['debugger_address']:
+                raise ValueError("Set 'debugger_address' in settings.yaml to serve a browser.")
+            serve_browser(settings['debugger_address'])
+            return
+
         secrets_file, connections_links_file = FileManager.validate_data_folder(data_folder)
         email, password = ConfigValidator.validate_secrets(secrets_file)
 
         printyellow("Initializing browser...")
-        browser = init_browser()
+        # Attach to the browser kept open by 'main.py --serve-browser' if it is running
+        attached = bool(settings['debugger_address']) and is_debugger_listening(settings['debugger_address'])
+        browser = init_browser(lean=settings['lean_profile'],
+                               debugger_address=settings['debugger_address'] if attached else None)
 
         printyellow("Starting LinkedIn authentication and data gathering...")
-        auth = LinkedInAuthenticator(driver=browser)
-        conector = LinkedInConector(connections_links_file, driver=browser)
+        waiter = PageWaiter(timeout=settings['wait_timeout'], poll_interval=settings['wait_poll_interval'])
+        auth = LinkedInAuthenticator(driver=browser, waiter=waiter, base_url=settings['base_url'])
+        conector = LinkedInConector(connections_links_file, driver=browser, storage_backend="sqlite",
+                                    extraction=settings['extraction'],
+                                    scroll_stall_seconds=settings['scroll_stall_seconds'],
+                                    incremental_sync=settings['incremental_sync'],
+                                    lean=settings['lean_profile'],
+                                    waiter=waiter,
+                                    scheduler=RateScheduler(rate_per_hour=settings['rate_per_hour'],
+                                                            max_rate_per_hour=settings['max_rate_per_hour'],
+                                                            max_pause_seconds=settings['max_pause_seconds'],
+                                                            max_blocks=settings['max_consecutive_blocks']),
+                                    metrics_export=settings['metrics_export'],
+                                    base_url=settings['base_url'])
 
         auth.set_secrets(email, password)
         auth.start()
-        conector.start()
 
+        browser_pool = None
+        if settings['workers'] > 1:
+            browser_pool = BrowserPool(lambda: init_browser(use_profile=False, lean=settings['lean_profile']),
+                                       settings['workers'] - 1,
+                                       cookies=auth.session_cookies(),
+                                       cookie_url=f"{auth.base_url}/robots.txt",
+                                       spares=settings['spare_browsers'])
+        http_fetcher = None
+        if settings['http_fetch']:
+            http_fetcher = HttpContactFetcher(auth.session_cookies(),
+                                              user_agent=browser.execute_script("return navigator.userAgent;"),
+                                              concurrency=settings['http_concurrency'])
+        conector.start(browser_pool, http_fetcher)
+
+    except SessionExpiredError as e:
+        printred(f"Scraping stopped: {e}")
+        if auth:
+            auth.forget_session()
+    except RateLimitError as e:
+        printred(f"Scraping stopped: {e}")
     except FileNotFoundError as e:
         printred(f"File error: {e}")
     except ValueError as e:
@@ -47,7 +107,12 @@ def main():
     except Exception as e:
         printred(f"Unexpected error: {e}")
     finally:
-        if browser:
+        if conector:
+            conector.close()
+        if browser and attached:
+            # Leave the served browser open and logged in for the next run
+            browser.service.stop()
+        elif browser:
             printyellow("Closing browser...")
             browser.quit()
 
@@ -6,6 +6,28 @@ import yaml
 class ConfigError(Exception):
     pass
 
+DEFAULT_SETTINGS = {
+    'workers': 1,
+    'extraction': 'script',
+    'scroll_stall_seconds': 3,
+    'incremental_sync': True,
+    'lean_profile': False,
+    'debugger_address': None,
+    'spare_browsers': 0,
+    'wait_timeout': 10,
+    'wait_poll_interval': 0.1,
+    'rate_per_hour': 600,
+    'max_rate_per_hour': 1800,
+    'max_pause_seconds': 3600,
+    'max_consecutive_blocks': 6,
+    'metrics_export': 'both',
+    'base_url': 'https://www.linkedin.com',
+    'http_fetch': False,
+    'http_concurrency': 8,
+}
+EXTRACTION_MODES = ('script', 'html', 'fields')
+METRICS_EXPORTS = ('json', 'prometheus', 'both', 'none')
+
 class ConfigValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
@@ -36,6 +58,45 @@ class ConfigValidator:
             raise ConfigError(f"Password cannot be empty in secrets file {secrets_yaml_path}.")
 
         return secrets['email'], str(secrets['password'])
+
+    @staticmethod
+    def validate_settings(settings_yaml_path: Path) -> dict:
+        settings = dict(DEFAULT_SETTINGS)
+        if not settings_yaml_path.exists():
+            return settings
+
+        loaded = ConfigValidator.validate_yaml_file(settings_yaml_path) or {}
+        unknown = [key for key in loaded if key not in DEFAULT_SETTINGS]
+        if unknown:
+            raise ConfigError(f"Unknown settings {', '.join(unknown)} in file {settings_yaml_path}")
+        settings.update(loaded)
+
+        # bool is a subclass of int, so 'workers: true' has to be rejected explicitly
+        for count in ('workers', 'http_concurrency', 'max_consecutive_blocks'):
+            if not isinstance(settings[count], int) or isinstance(settings[count], bool) or settings[count] < 1:
+                raise ConfigError(f"'{count}' must be a positive integer in settings file {settings_yaml_path}.")
+        for number in ('scroll_stall_seconds', 'wait_timeout', 'wait_poll_interval', 'rate_per_hour', 'max_rate_per_hour',
+                       'max_pause_seconds'):
+            if not isinstance(settings[number], (int, float)) or isinstance(settings[number], bool) or settings[number] <= 0:
+                raise ConfigError(f"'{number}' must be a positive number in settings file {settings_yaml_path}.")
+        if settings['rate_per_hour'] > settings['max_rate_per_hour']:
+            raise ConfigError(f"'rate_per_hour' cannot be above 'max_rate_per_hour' in settings file {settings_yaml_path}.")
+        for flag in ('incremental_sync', 'lean_profile', 'http_fetch'):
+            if not isinstance(settings[flag], bool):
+                raise ConfigError(f"'{flag}' must be true or false in settings file {settings_yaml_path}.")
+        if not isinstance(settings['spare_browsers'], int) or isinstance(settings['spare_browsers'], bool) \
+                or settings['spare_browsers'] < 0:
+            raise ConfigError(f"'spare_browsers' must be zero or a positive integer in settings file {settings_yaml_path}.")
+        if settings['debugger_address'] is not None and not re.match(r'^[\w.-]+:\d+$', str(settings['debugger_address'])):
+            raise ConfigError(f"'debugger_address' must look like 'host:port' in settings file {settings_yaml_path}.")
+        if settings['extraction'] not in EXTRACTION_MODES:
+            raise ConfigError(f"'extraction' must be one of {', '.join(EXTRACTION_MODES)} in settings file {settings_yaml_path}.")
+        if not re.match(r'^https?://[^/]+/?$', str(settings['base_url'])):
+            raise ConfigError(f"'base_url' must be a URL like 'https://www.linkedin.com' in settings file {settings_yaml_path}.")
+        if settings['metrics_export'] not in METRICS_EXPORTS:
+            raise ConfigError(f"'metrics_export' must be one of {', '.join(METRICS_EXPORTS)} in settings file {settings_yaml_path}.")
+
+        return settings
     
 class FileManager:
     @staticmethod
@@ -0,0 +1,141 @@
+import queue
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from src.utils import LINKEDIN_URL, printred, printyellow
+from src.workQueue import WorkQueue
+
+
+class BrowserPool:
+    def __init__(self, browser_factory, size: int, cookies: list = None,
+                 cookie_url: str = f"{LINKEDIN_URL}/robots.txt", spares: int = 0, max_recycles: int = 3):
+        """
+        Pool of WebDriver workers that scrape pending connections concurrently.
+        Every worker gets its own browser, logged in with the session cookies of the authenticated browser.
+        :param browser_factory: Callable returning a new WebDriver.
+        :param size: Number of extra browsers to open.
+        :param cookies: Session cookies of the authenticated browser (driver.get_cookies()).
+        :param cookie_url: Lightweight page of the cookie domain, loaded before the cookies can be set.
+        :param spares: Number of started, logged-in browsers kept ready to replace crashed workers.
+        :param max_recycles: Times a worker replaces its browser after a browser error before stopping.
+        """
+        self.browser_factory = browser_factory
+        self.size = size
+        self.cookies = cookies or []
+        self.cookie_url = cookie_url
+        self.spares = spares
+        self.max_recycles = max_recycles
+        self._spare_browsers = queue.Queue()
+        # Threads starting spare browsers; joined on cleanup so no browser is started after the spares are closed
+        self._warmers = []
+        self._warming = 0
+        self._closing = False
+        self._spare_lock = threading.Lock()
+
+    def run(self, conector, queue: WorkQueue) -> None:
+        """
+        Drains the queue with the conector's own browser plus the pool's browsers.
+        :param conector: Authenticated LinkedInConector; its browser works as one more worker.
+        :param queue: Queue of pending connections shared by every worker.
+        """
+        self._closing = False
+        threads = [threading.Thread(target=self._work, args=(conector, queue), name=f"browser-worker-{i + 1}")
+                   for i in range(self.size)]
+        for thread in threads:
+            thread.start()
+        for _ in range(self.spares):
+            self._warm_spare()
+        try:
+            conector.drain(queue)
+        finally:
+            for thread in threads:
+                thread.join()
+            self._close_spares()
+
+    def _warm_spare(self) -> None:
+        """
+        Starts a spare browser in the background if the ready and starting spares are below 'spares'.
+        """
+        with self._spare_lock:
+            if self._closing or self._spare_browsers.qsize() + self._warming >= self.spares:
+                return
+            self._warming += 1
+            thread = threading.Thread(target=self._warm, name="browser-warmer", daemon=True)
+            self._warmers = [warmer for warmer in self._warmers if warmer.is_alive()] + [thread]
+        thread.start()
+
+    def _warm(self) -> None:
+        driver = None
+        try:
+            driver = self._open_browser()
+        except Exception as e:
+            printred(f"Could not start a spare browser: {e}")
+        with self._spare_lock:
+            self._warming -= 1
+            if driver and not self._closing:
+                self._spare_browsers.put(driver)
+                return
+        if driver:
+            # Started after the pool closed its spares
+            self._quit(driver)
+
+    def _take_browser(self):
+        """
+        Returns a ready spare browser if there is one (starting another in the background), or a new one.
+        """
+        try:
+            driver = self._spare_browsers.get_nowait()
+        except queue.Empty:
+            return self._open_browser()
+        self._warm_spare()
+        return driver
+
+    def _close_spares(self) -> None:
+        """
+        Stops starting spares, waits for the ones being started and quits every ready spare.
+        """
+        with self._spare_lock:
+            self._closing = True
+            warmers = list(self._warmers)
+        for warmer in warmers:
+            warmer.join()
+        while True:
+            try:
+                self._spare_browsers.get_nowait().quit()
+            except queue.Empty:
+                return
+            except Exception:
+                pass
+
+    def _open_browser(self):
+        driver = self.browser_factory()
+        driver.get(self.cookie_url)
+        for cookie in self.cookies:
+            driver.add_cookie(cookie)
+        return driver
+
+    def _work(self, conector, queue: WorkQueue) -> None:
+        name = threading.current_thread().name
+        for attempt in range(self.max_recycles + 1):
+            driver = None
+            try:
+                driver = self._take_browser()
+                printyellow(f"{name} started.")
+                conector.with_driver(driver).drain(queue)
+                return
+            except WebDriverException as e:
+                printred(f"{name} browser failed ({attempt + 1}/{self.max_recycles + 1}): {e}")
+            except Exception as e:
+                printred(f"{name} stopped: {e}")
+                return
+            finally:
+                if driver:
+                    self._quit(driver)
+
+    @staticmethod
+    def _quit(driver) -> None:
+        try:
+            driver.quit()
+        except Exception:
+            pass
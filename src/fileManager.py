@@ -1,101 +1,69 @@
-import json
-from functools import wraps
-
-def validate_json(method):
-    """
-    Decorator to validate JSON data before performing operations.
-    Ensures that the file contains a valid structure.
-    """
-    @wraps(method)
-    def wrapper(self, *args, **kwargs):
-        data = self._load_json()
-        if not isinstance(data, dict):
-            raise ValueError("JSON data must be a dictionary.")
-        for key in ["connections", "scraped_texts", "persons"]:
-            if key not in data:
-                data[key] = []
-        self._save_json(data)
-        return method(self, *args, **kwargs)
-    return wrapper
+from src.storage import open_backend
+from src.summary import ScrapeSummary, summary_path_for
 
 class FileManager:
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, backend: str = "json", summary: bool = True, checkpoint_every: int = 100):
         """
         Initializes the FileManager with the path to the JSON file.
         :param file_path: Path to the JSON file.
+        :param backend: Storage backend ('json' or 'sqlite'). The SQLite backend stores the data in
+                        a '.db' file next to the JSON file and writes the JSON layout back at checkpoints
+                        and on close().
+        :param summary: Whether to keep the statistics of the stored persons up to date in a
+                        '.summary.json' file next to the JSON file.
+        :param checkpoint_every: Number of completed connections after which the SQLite backend writes
+                                 the JSON file again, so it is never far behind after a crash.
         """
         self.file_path = file_path
+        self.backend = backend
+        self.checkpoint_every = checkpoint_every
+        self._since_checkpoint = 0
+        # The backend keeps the profile index of every collection, so lookups go straight to it
+        self.storage = open_backend(file_path, backend)
+        self.summary = None
+        if summary:
+            self.summary = ScrapeSummary(summary_path_for(file_path), persons=self.get_all_persons())
 
-    def _load_json(self):
-        """
-        Loads and returns the JSON data from the file.
-        :return: JSON data as a dictionary.
-        """
-        try:
-            with open(self.file_path, "r", encoding='utf-8') as file:
-                return json.load(file)
-        except FileNotFoundError:
-            return {"connections": [], "scraped_texts": [], "persons": []}
-        except json.JSONDecodeError:
-            raise ValueError("Invalid JSON format in the file.")
-
-    def _save_json(self, data: dict) -> None:
-        """
-        Saves the JSON data to the file.
-        :param data: Dictionary to save as JSON.
-        """
-        with open(self.file_path, "w", encoding='utf-8') as file:
-            json.dump(data, file, indent=4, ensure_ascii=False)
-
-    @validate_json
     def connection_exists(self, profile: str) -> bool:
         """
         Checks if a connection already exists in either 'connections' or 'scraped_texts'.
         :param profile: Profile identifier to check.
         :return: True if the profile exists, False otherwise.
         """
-        data = self._load_json()
-        connections = data.get("connections", [])
-        scraped_texts = data.get("scraped_texts", [])
+        return self.storage.contains("connections", profile) or \
+               self.storage.contains("scraped_texts", profile)
 
-        return any(conn["profile"] == profile for conn in connections) or \
-               any(scraped["profile"] == profile for scraped in scraped_texts)
-
-    @validate_json
     def add_connections(self, new_connections: list) -> None:
         """
         Adds new connections to the 'connections' list if they are not duplicates.
-        :param new_connections: List of connection dictionaries to add.
+        :param new_connections: List of connection links to add.
         """
-        data = self._load_json()
-        existing_profiles = {conn for conn in data.get("connections", [])}
-        scraped_profiles = {scraped for scraped in data.get("scraped_texts", [])}
+        filtered_connections = [conn for conn in dict.fromkeys(new_connections) if not self.connection_exists(conn)]
 
-        filtered_connections = [conn for conn in new_connections
-                                if conn not in existing_profiles and
-                                conn not in scraped_profiles]
+        if filtered_connections:
+            self.storage.append("connections", filtered_connections)
 
-        data["connections"].extend(filtered_connections)
-        self._save_json(data)
+    def is_pending(self, profile: str) -> bool:
+        """
+        Checks if a connection is still waiting to be scraped.
+        :param profile: Profile identifier to check.
+        :return: True if the profile is in 'connections', False otherwise.
+        """
+        return self.storage.contains("connections", profile)
 
-    @validate_json
-    def get_next_connection(self) -> dict:
+    def get_next_connection(self) -> str:
         """
         Retrieves and removes the first connection from the 'connections' list.
         Moves it to 'scraped_texts' after retrieval.
-        :return: The first connection dictionary or None if no connections exist.
+        :return: The first connection link or None if no connections exist.
         """
-        data = self._load_json()
-        if not data.get("connections"):
+        next_connection = self.storage.first("connections")
+        if next_connection is None:
             return None
 
-        next_connection = data["connections"].pop(0)
-        data.setdefault("scraped_texts", []).append(next_connection)
-        self._save_json(data)
-
+        self.storage.move(next_connection, "connections", "scraped_texts")
         return next_connection
 
-    @validate_json
     def add_person(self, person_data: dict) -> None:
         """
         Adds a person's data to the 'persons' list.
@@ -104,41 +72,83 @@ class FileManager:
         if not isinstance(person_data, dict):
             raise ValueError("Person data must be a dictionary.")
 
-        data = self._load_json()
-        if not any(person["profile"] == person_data["profile"] for person in data.get("persons", [])):
-            data.setdefault("persons", []).append(person_data)
-            self._save_json(data)
+        if not self.storage.contains("persons", person_data["profile"]):
+            self.storage.append("persons", [person_data])
+            self._add_to_summary(person_data)
 
-    @validate_json
     def get_all_persons(self) -> list:
         """
         Retrieves all persons stored in the JSON file.
         :return: List of persons.
         """
-        data = self._load_json()
-        return data.get("persons", [])
-    
-    @validate_json
+        return self.storage.all("persons")
+
     def get_connections(self) -> list:
         """
         Retrieves all connections stored in the JSON file.
         :return: List of connections.
         """
-        data = self._load_json()
-        return data.get("connections", [])
-    
-    @validate_json
+        return self.storage.all("connections")
+
     def remove_connection(self, connection) -> None:
         """
         Removes a connection from the 'connections' list and adds it to 'scraped_texts'.
-        :param connection: Connection dictionary to remove.
+        :param connection: Connection link to remove.
+        """
+        self.storage.move(connection, "connections", "scraped_texts")
+
+    def complete_connection(self, connection: str, person_data: dict) -> None:
+        """
+        Stores the person scraped from a connection and moves the connection to 'scraped_texts'.
+        Both changes are persisted together, so an interrupted run never leaves one without the other.
+        :param connection: Connection link that was scraped.
+        :param person_data: Dictionary containing the person's data.
+        """
+        if not isinstance(person_data, dict):
+            raise ValueError("Person data must be a dictionary.")
+
+        is_new = not self.storage.contains("persons", person_data["profile"])
+        self.storage.complete(connection, person_data)
+        if is_new:
+            self._add_to_summary(person_data)
+        self._checkpoint()
+
+    def _checkpoint(self) -> None:
+        """
+        Writes the JSON file every checkpoint_every completed connections when the data lives in SQLite.
+        """
+        if self.backend == "json" or not self.checkpoint_every:
+            return
+        self._since_checkpoint += 1
+        if self._since_checkpoint >= self.checkpoint_every:
+            self._since_checkpoint = 0
+            self.export_json()
+
+    def _add_to_summary(self, person_data: dict) -> None:
+        if self.summary:
+            self.summary.add(person_data)
+
+    def import_json(self, file_path: str) -> None:
+        """
+        Imports connections, scraped texts and persons from a JSON file with the current layout.
+        :param file_path: Path to the JSON file.
         """
-        data = self._load_json()
-        connections = data.get("connections", [])
-        scraped_texts = data.get("scraped_texts", [])
+        self.storage.import_json(file_path)
+        if self.summary:
+            self.summary = ScrapeSummary(self.summary.file_path, persons=self.get_all_persons())
 
-        if connection in connections:
-            connections.remove(connection)
-            scraped_texts.append(connection)
+    def export_json(self, file_path: str = None) -> None:
+        """
+        Exports every collection to a JSON file with the current layout.
+        :param file_path: Path to the JSON file; defaults to the managed JSON file.
+        """
+        self.storage.export_json(file_path or self.file_path)
 
-        self._save_json(data)
\ No newline at end of file
+    def close(self) -> None:
+        """
+        Writes the JSON layout back to the managed file and releases the storage backend.
+        """
+        self.export_json()
+        if self.summary:
+            self.summary.save()
+        self.storage.close()
\ No newline at end of file
@@ -0,0 +1,138 @@
+import asyncio
+import importlib.util
+import time
+
+from src.person import Person
+from src.rateScheduler import detect_block
+from src.utils import printred, printyellow
+from src.workQueue import WorkQueue
+
+# HTTP statuses LinkedIn answers with when it throttles or blocks automated traffic
+THROTTLE_STATUSES = (429, 999)
+
+
+class HttpContactFetcher:
+    # Seconds an idle request loop waits before checking again for connections released by the others
+    IDLE_POLL_SECONDS = 0.2
+
+    def __init__(self, cookies: list, user_agent: str = None, concurrency: int = 8, timeout: float = 20,
+                 keepalive: float = 30):
+        """
+        Fetches contact-info pages over plain HTTP with the session cookies of the logged-in browser,
+        instead of loading each page in Chrome. Requests share one pooled keep-alive connection set and
+        at most 'concurrency' of them are in flight. Pages are parsed with Person.from_html; the ones
+        that only render with JavaScript, or fail, stay pending for the browser.
+        :param cookies: Session cookies of the authenticated browser (LinkedInAuthenticator.session_cookies()).
+        :param user_agent: User agent of the browser the cookies come from.
+        :param concurrency: Maximum number of requests in flight.
+        :param timeout: Seconds before a request is given up.
+        :param keepalive: Seconds idle connections are kept open for reuse.
+        """
+        self.cookie_header = "; ".join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+        self.user_agent = user_agent
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.keepalive = keepalive
+        # Set once LinkedIn redirects a request to the login page: the rest is left for the browser
+        self._rejected = False
+
+    def run(self, conector, queue: WorkQueue) -> None:
+        """
+        Drains the queue over HTTP. Connections whose page needs a browser are released without
+        being stored, so they are still pending when the browser goes through the connections.
+        :param conector: LinkedInConector whose scheduler, metrics and settings are used.
+        :param queue: Queue of pending connections.
+        """
+        asyncio.run(self._run(conector, queue))
+
+    async def _run(self, conector, queue: WorkQueue) -> None:
+        try:
+            import aiohttp
+        except ImportError:
+            raise ImportError("Fetching pages over HTTP requires aiohttp. Install it with 'pip install aiohttp'.")
+        if importlib.util.find_spec("lxml") is None:
+            raise ImportError("Parsing HTML pages requires lxml. Install it with 'pip install lxml'.")
+
+        headers = {"Cookie": self.cookie_header, "Accept": "text/html"}
+        if self.user_agent:
+            headers["User-Agent"] = self.user_agent
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=self.keepalive)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        self._rejected = False
+        async with aiohttp.ClientSession(connector=connector, headers=headers, timeout=timeout) as session:
+            await asyncio.gather(*(self._work(session, conector, queue) for _ in range(self.concurrency)))
+
+    async def _work(self, session, conector, queue: WorkQueue) -> None:
+        import aiohttp
+        from lxml import etree
+
+        metrics = conector.metrics
+        while not self._rejected:
+            # The scheduler blocks while it paces or pauses the visits, so it waits in a thread
+            await asyncio.to_thread(conector.scheduler.acquire)
+            lease = await self._claim(queue)
+            if lease is None:
+                return
+
+            started = time.perf_counter()
+            try:
+                async with session.get(conector._connection_link_contact_info(lease.profile)) as response:
+                    html = await response.text()
+                    status = response.status
+                    # Block pages are only reached through a redirect: judge them by where the redirect ended
+                    redirect = str(response.url) if response.history else None
+            except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+                queue.nack(lease, requeue=False)
+                metrics.increment("http_errors")
+                continue
+            latency = time.perf_counter() - started
+            metrics.observe("http_fetch", latency)
+
+            block = "throttle" if status in THROTTLE_STATUSES else redirect and detect_block(redirect)
+            if block in ("login", "authwall"):
+                # The cookies do not authenticate plain HTTP requests: everything is left for the browser
+                queue.nack(lease, requeue=False)
+                if not self._rejected:
+                    self._rejected = True
+                    printred("LinkedIn did not accept the session cookies over HTTP. Continuing with the browser.")
+                return
+            if block:
+                queue.nack(lease)
+                conector.scheduler.record_block(block)
+                metrics.increment("blocks")
+                metrics.increment("retries")
+                continue
+
+            person = None
+            if status == 200:
+                with metrics.span("extraction"):
+                    try:
+                        person = Person.from_html(html, lease.profile)
+                    except (etree.LxmlError, ValueError):
+                        # Empty or truncated body: the browser loads the page again
+                        person = None
+            if person is None or not person.name:
+                # Rendered with JavaScript (or not a contact-info page): left for the browser
+                queue.nack(lease, requeue=False)
+                metrics.increment("http_fallbacks")
+                continue
+
+            conector.scheduler.record_success(latency)
+            # The write to SQLite or JSON runs off the event loop, so in-flight requests are not stalled
+            with metrics.span("storage"):
+                await asyncio.to_thread(queue.ack, lease, person.to_dict())
+            metrics.increment("successes")
+            if conector.show_terminal:
+                printyellow(person)
+
+    async def _claim(self, queue: WorkQueue):
+        """
+        Claims the next connection, waiting while other requests hold leases that may go back to the queue.
+        :return: A Lease, or None once nothing is pending and nothing is in flight (or the cookies were rejected).
+        """
+        while not self._rejected:
+            lease = queue.claim()
+            if lease is not None or not queue.in_flight:
+                return lease
+            await asyncio.sleep(self.IDLE_POLL_SECONDS)
+        return None
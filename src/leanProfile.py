@@ -0,0 +1,61 @@
+import json
+
+from src.utils import printyellow
+
+# URL patterns blocked through the DevTools protocol ('*' matches any sequence of characters)
+BLOCKED_URL_PATTERNS = [
+    # Fonts
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # Images and media (images are also disabled through the browser prefs)
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg",
+    "*media.licdn.com/dms/image*", "*dms.licdn.com/playlist*",
+    # Analytics, ads and tracking
+    "*linkedin.com/li/track*", "*linkedin.com/sensorCollect*", "*px.ads.linkedin.com*",
+    "*snap.licdn.com*", "*platform.linkedin.com/litms*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*bat.bing.com*", "*connect.facebook.net*", "*ads-twitter.com*",
+]
+
+
+def apply_lean_profile(driver, patterns: list = None) -> None:
+    """
+    Blocks fonts, media and tracking requests at the network level through the DevTools protocol.
+    Must be called once per browser, before the first navigation.
+    :param driver: Chrome WebDriver.
+    :param patterns: URL patterns to block; defaults to BLOCKED_URL_PATTERNS.
+    """
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns or BLOCKED_URL_PATTERNS})
+
+
+def collect_page_traffic(driver) -> dict:
+    """
+    Summarizes the network traffic recorded since the last call, from the Chrome performance log.
+    Needs the 'goog:loggingPrefs' performance capability set by chromeBrowserOptions(lean=True).
+    :param driver: Chrome WebDriver.
+    :return: Number of requests, bytes transferred and requests blocked.
+    """
+    traffic = {"requests": 0, "bytes": 0, "blocked": 0}
+    try:
+        entries = driver.get_log("performance")
+    except Exception:
+        return traffic
+
+    for entry in entries:
+        message = json.loads(entry["message"])["message"]
+        method = message.get("method")
+        if method == "Network.requestWillBeSent":
+            traffic["requests"] += 1
+        elif method == "Network.loadingFinished":
+            traffic["bytes"] += int(message["params"].get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and message["params"].get("blockedReason"):
+            traffic["blocked"] += 1
+    return traffic
+
+
+def log_page_traffic(driver, url: str) -> dict:
+    traffic = collect_page_traffic(driver)
+    printyellow(f"{url}: {traffic['requests']} requests, {traffic['bytes'] / 1024:.1f} KB transferred, "
+                f"{traffic['blocked']} requests blocked.")
+    return traffic
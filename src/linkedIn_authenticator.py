@@ -1,41 +1,143 @@
+import hashlib
+import json
 import time
-from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pathlib import Path
+from selenium.common.exceptions import NoSuchElementException, TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
-from src.utils import printyellow, printred
+from src.pageWait import PageWaiter, feed_ready
+from src.utils import LINKEDIN_URL, printyellow, printred
+
+SESSION_COOKIE = "li_at"
+SESSION_FILE = Path("data_folder") / "session.json"
+# Seconds a verified session cookie is trusted before it is checked again against the feed
+SESSION_VERIFY_INTERVAL = 24 * 60 * 60
 
 class LinkedInAuthenticator:
-    def __init__(self, driver=None):
+    def __init__(self, driver=None, session_file: Path = SESSION_FILE, verify_interval: float = SESSION_VERIFY_INTERVAL,
+                 waiter: PageWaiter = None, base_url: str = LINKEDIN_URL):
+        """
+        Logs the browser in to LinkedIn, skipping any navigation when the stored session is still valid.
+        :param driver: Chrome WebDriver.
+        :param session_file: JSON file caching when the session cookie was last verified.
+        :param verify_interval: Seconds a verified session cookie is trusted without loading a page.
+        :param waiter: PageWaiter used to wait for the feed.
+        :param base_url: Base URL of LinkedIn (or of a local stand-in server).
+        """
         self.driver = driver
         self.email = ""
         self.password = ""
+        self.session_file = Path(session_file)
+        self.verify_interval = verify_interval
+        self.waiter = waiter or PageWaiter()
+        self.base_url = base_url.rstrip('/')
 
     def set_secrets(self, email, password):
         self.email = email
         self.password = password
 
     def start(self):
-        printyellow("Starting Chrome browser to log in to LinkedIn.")
-        self.driver.get('https://www.linkedin.com')
-        self._wait_for_page_load()
-        if not self.is_logged_in():
-            self._handle_login()
+        printyellow("Checking the LinkedIn session...")
+        if self.is_logged_in():
+            print("User is already logged in.")
+            return
+        self._handle_login()
         return
 
+    def session_cookies(self) -> list:
+        """
+        Returns the cookies of the authenticated session, to log other browsers in without credentials.
+        """
+        cookies = self._linkedin_cookies()
+        if cookies is None:
+            return self.driver.get_cookies()
+        return [self._as_webdriver_cookie(cookie) for cookie in cookies]
+
+    def _linkedin_cookies(self):
+        """
+        Reads the browser's LinkedIn cookies through the DevTools protocol, which works from any page.
+        :return: List of DevTools cookies, or None if the browser does not support it.
+        """
+        try:
+            return self.driver.execute_cdp_cmd("Network.getCookies", {"urls": [self.base_url]})["cookies"]
+        except (AttributeError, WebDriverException):
+            return None
+
+    @staticmethod
+    def _as_webdriver_cookie(cookie: dict) -> dict:
+        converted = {key: cookie[key] for key in ("name", "value", "domain", "path", "secure", "httpOnly")}
+        if cookie.get("expires", -1) > 0:
+            converted["expiry"] = int(cookie["expires"])
+        if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+            converted["sameSite"] = cookie["sameSite"]
+        return converted
+
+    def _session_cookie(self):
+        cookies = self._linkedin_cookies()
+        if cookies is None:
+            cookies = [{**cookie, "expires": cookie.get("expiry", -1)} for cookie in self.driver.get_cookies()]
+        return next((cookie for cookie in cookies if cookie["name"] == SESSION_COOKIE), None)
+
+    @staticmethod
+    def _fingerprint(cookie: dict) -> str:
+        return hashlib.sha256(cookie["value"].encode()).hexdigest()
+
+    def _last_verified(self) -> dict:
+        try:
+            with open(self.session_file, "r", encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _mark_verified(self) -> None:
+        cookie = self._session_cookie()
+        if not cookie:
+            return
+        with open(self.session_file, "w", encoding='utf-8') as file:
+            json.dump({"fingerprint": self._fingerprint(cookie), "verified_at": time.time()}, file)
+
+    def forget_session(self) -> None:
+        """
+        Drops the cached verification, so the next run checks the session against the feed again.
+        """
+        self.session_file.unlink(missing_ok=True)
+
+    def is_logged_in(self) -> bool:
+        """
+        Checks the session from the li_at cookie, without loading any page while its last verification is recent.
+        An expired or missing cookie means logged out; an unverified or stale one is checked once against the feed,
+        which redirects to the login page (in any UI language) when the session is no longer valid.
+        """
+        cookie = self._session_cookie()
+        now = time.time()
+        if not cookie or 0 < cookie.get("expires", -1) <= now:
+            return False
+
+        last_verified = self._last_verified()
+        if (last_verified.get("fingerprint") == self._fingerprint(cookie)
+                and now - last_verified.get("verified_at", 0) < self.verify_interval):
+            return True
+
+        self.driver.get(f'{self.base_url}/feed/')
+        if '/feed' not in self.driver.current_url or not self.waiter.wait(self.driver, 'feed', feed_ready):
+            return False
+        self._mark_verified()
+        return True
+
     def _handle_login(self):
         printyellow("Navigating to the LinkedIn login page...")
-        self.driver.get("https://www.linkedin.com/login")
+        self.driver.get(f"{self.base_url}/login")
         if 'feed' in self.driver.current_url:
             print("User is already logged in.")
+            self._mark_verified()
             return
         try:
             self._enter_credentials()
             self._submit_login_form()
         except NoSuchElementException:
             printred("Could not log in to LinkedIn. Please check your credentials.")
-        time.sleep(5)  # Breve pausa antes de manejar el siguiente paso
         self._handle_security_check()
 
     def _enter_credentials(self):
@@ -58,35 +160,17 @@ class LinkedInAuthenticator:
 
     def _handle_security_check(self):
         try:
-            WebDriverWait(self.driver, 10).until(
-                EC.url_contains('https://www.linkedin.com/checkpoint/challengesV2/')
-            )
-            printyellow("Security checkpoint detected. Please complete the challenge.")
-            WebDriverWait(self.driver, 300).until(
-                EC.url_contains('https://www.linkedin.com/feed/')
-            )
-            print("Security check completed.")
-        except TimeoutException:
-            printred("Security check not completed. Please try again later.")
-
-    def is_logged_in(self):
-        self.driver.get('https://www.linkedin.com/feed')
-        try:
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CLASS_NAME, 'share-box-feed-entry__trigger'))
-            )
-            buttons = self.driver.find_elements(By.CLASS_NAME, 'share-box-feed-entry__trigger')
-            if any(button.text.strip() == 'Start a post' for button in buttons):
-                print("User is already logged in.")
-                return True
-        except TimeoutException:
-            pass
-        return False
-
-    def _wait_for_page_load(self, timeout=10):
-        try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda d: d.execute_script('return document.readyState') == 'complete'
-            )
+            # Wait for the login to land on the feed or on a security checkpoint, whichever comes first
+            WebDriverWait(self.driver, 15).until(EC.any_of(
+                EC.url_contains(f'{self.base_url}/feed/'),
+                EC.url_contains(f'{self.base_url}/checkpoint/challengesV2/'),
+            ))
+            if 'checkpoint/challengesV2' in self.driver.current_url:
+                printyellow("Security checkpoint detected. Please complete the challenge.")
+                WebDriverWait(self.driver, 300).until(
+                    EC.url_contains(f'{self.base_url}/feed/')
+                )
+                print("Security check completed.")
+            self._mark_verified()
         except TimeoutException:
-            printred("Page load timed out.")
\ No newline at end of file
+            printred("Login or security check not completed. Please try again later.")
\ No newline at end of file
@@ -1,72 +1,230 @@
-from selenium.common.exceptions import NoSuchElementException
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+import copy
+import time
+
+from selenium.common.exceptions import TimeoutException
 
 from src.person import Person
 from src.fileManager import FileManager
-from src.utils import scroll_to_end, printyellow
+from src.workQueue import WorkQueue
+from src.leanProfile import log_page_traffic
+from src.metrics import Metrics, metrics_paths_for
+from src.pageWait import PageWaiter, connection_cards_ready, contact_info_ready
+from src.rateScheduler import RateScheduler, detect_block
+from src.utils import LINKEDIN_URL, scroll_until_stable, printyellow
 
 class LinkedInConector:
 
-    def __init__(self, connection_links_file: str, driver=None):
+    CONNECTION_CARD_CLASS = "mn-connection-card__details"
+    # Seconds an idle worker waits before checking again for connections released by other workers
+    IDLE_POLL_SECONDS = 1.0
+    # Returns the profile links of the connection cards from a given position onwards
+    CARD_LINKS_SCRIPT = """
+        const [cardSelector, start] = arguments;
+        return Array.from(document.querySelectorAll(cardSelector)).slice(start).map((card) => {
+            const link = card.querySelector('a');
+            return link ? link.href : null;
+        });
+    """
+
+    def __init__(self, connection_links_file: str, driver=None, storage_backend: str = "json",
+                 extraction: str = "script", scroll_stall_seconds: float = 3.0,
+                 incremental_sync: bool = True, known_run: int = 20, lean: bool = False, waiter: PageWaiter = None,
+                 scheduler: RateScheduler = None, metrics: Metrics = None, metrics_export: str = "both",
+                 base_url: str = LINKEDIN_URL, show_terminal: bool = True):
         self.driver = driver
-        self.fm = FileManager(connection_links_file)
+        self.fm = FileManager(connection_links_file, backend=storage_backend)
+        # 'script' (one execute_script call), 'html' (parse page_source) or 'fields' (one lookup per field)
+        self.extraction = extraction
+        self.scroll_stall_seconds = scroll_stall_seconds
+        # Connections are listed newest first, so an incremental sync stops after known_run known profiles in a row
+        self.incremental_sync = incremental_sync
+        self.known_run = known_run
+        # Browsers with the lean profile load pages eagerly and log the traffic of each contact page
+        self.lean = lean
+        # Shared by the copies made with with_driver, so the wait timings of every worker end up together
+        self.waiter = waiter or PageWaiter()
+        # Paces the profile visits of every worker; shared by the copies made with with_driver too
+        self.scheduler = scheduler or RateScheduler()
+        # Stage timings and counters, written next to the connections file on close()
+        # as a JSON summary and/or a Prometheus textfile ('json', 'prometheus', 'both' or 'none')
+        self.metrics = metrics or Metrics()
+        self.metrics_export = metrics_export
+        self.base_url = base_url.rstrip('/')
+        # Whether every scraped person is printed
+        self.show_terminal = show_terminal
+        # Connections whose page timed out once; shared by the copies made with with_driver
+        self._timed_out = set()
 
-    def start(self):
-        self.goToMyConnections()
+    def start(self, browser_pool=None, http_fetcher=None):
         printyellow('Gathering connections...')
-        connection_links = self.get_connections_links()
+        with self.metrics.span("sync"):
+            connection_links = self.sync_connections(incremental=self.incremental_sync)
+        printyellow(f'{len(connection_links)} new connections found.')
         self.fm.add_connections(connection_links)
-        self.gather_all_contact_info(self.fm.get_connections())
+        self.gather_all_contact_info(browser_pool, http_fetcher)
+
+    def close(self):
+        self.waiter.report()
+        self.scheduler.report()
+        self.export_metrics()
+        self.fm.close()
+
+    def export_metrics(self):
+        json_path, prometheus_path = metrics_paths_for(self.fm.file_path)
+        if self.metrics_export in ("json", "both"):
+            self.metrics.export_json(json_path)
+        if self.metrics_export in ("prometheus", "both"):
+            self.metrics.export_prometheus(prometheus_path)
 
     def goToMyConnections(self):
-        self.driver.get('https://www.linkedin.com/mynetwork/invite-connect/connections/')
-        self._wait_for_page_load()
-        self._scroll_to_end()
+        self.driver.get(f'{self.base_url}/mynetwork/invite-connect/connections/')
+        self.waiter.wait(self.driver, 'connections', connection_cards_ready(f".{self.CONNECTION_CARD_CLASS}"))
+
+    def sync_connections(self, incremental: bool = True) -> list[str]:
+        """
+        Harvests the connection links while the connections list is scrolled.
+        :param incremental: Whether to stop at the first run of known_run profiles already in the FileManager.
+        :return: Links of the connections that are not in the FileManager yet.
+        """
+        self.goToMyConnections()
+        new_links = []
+        harvested = 0
+        known_streak = 0
+
+        def harvest(cards: int) -> bool:
+            nonlocal harvested, known_streak
+            if cards <= harvested:
+                return False
+            links = self.driver.execute_script(self.CARD_LINKS_SCRIPT, f".{self.CONNECTION_CARD_CLASS}", harvested)
+            harvested += len(links)
+            for link in filter(None, links):
+                if self.fm.connection_exists(link):
+                    known_streak += 1
+                else:
+                    known_streak = 0
+                    new_links.append(link)
+            return incremental and known_streak >= self.known_run
+
+        cards = scroll_until_stable(self.driver, f".{self.CONNECTION_CARD_CLASS}",
+                                    stall_seconds=self.scroll_stall_seconds, on_progress=harvest)
+        printyellow(f'Loaded {cards} connection cards.')
+        if self.lean:
+            log_page_traffic(self.driver, self.driver.current_url)
+        return new_links
 
     def gather_contact_info(self, connection_link: str, show_terminal: bool = True) -> Person:
         contact_info_link = self._connection_link_contact_info(connection_link)
         self._go_to(contact_info_link)
-        person = Person(self.driver)
-        person.gather_all_info()
-        person.set_profile(connection_link)
-        
+        with self.metrics.span("extraction"):
+            if self.extraction == "html":
+                person = Person.from_html(self.driver.page_source, connection_link)
+            else:
+                person = Person(self.driver)
+                person.gather_all_info(single_call=self.extraction == "script")
+                person.set_profile(connection_link)
+
         if show_terminal:
             printyellow(person)
 
         return person
 
-    def gather_all_contact_info(self, connection_links: list[str]):
-        for link in connection_links:
-            person = self.gather_contact_info(link)
-            self.fm.add_person(person.to_dict())
-            self.fm.remove_connection(link)
+    def with_driver(self, driver) -> "LinkedInConector":
+        """
+        Returns a conector that scrapes with another browser and shares this conector's FileManager.
+        """
+        conector = copy.copy(self)
+        conector.driver = driver
+        return conector
+
+    def gather_all_contact_info(self, browser_pool=None, http_fetcher=None):
+        queue = WorkQueue(self.fm)
+        printyellow(f'{len(queue)} connections pending.')
+        if http_fetcher:
+            http_fetcher.run(self, queue)
+            # The connections still pending need a browser (pages rendered with JavaScript or failed requests)
+            queue = WorkQueue(self.fm)
+            printyellow(f'{len(queue)} connections left for the browser.')
+        if browser_pool:
+            browser_pool.run(self, queue)
+        else:
+            self.drain(queue)
+
+    def drain(self, queue: WorkQueue):
+        while True:
+            self.scheduler.acquire()
+            lease = self._claim(queue)
+            if lease is None:
+                return
+            with self.metrics.trace(lease.profile) as trace:
+                trace["outcome"] = self._scrape_lease(queue, lease)
+
+    def _claim(self, queue: WorkQueue):
+        """
+        Claims the next connection, waiting while other workers hold leases that may go back to the queue.
+        :return: A Lease, or None once nothing is pending and nothing is in flight.
+        """
+        while True:
+            lease = queue.claim()
+            if lease is not None or not queue.in_flight:
+                return lease
+            time.sleep(self.IDLE_POLL_SECONDS)
+
+    def _scrape_lease(self, queue: WorkQueue, lease) -> str:
+        """
+        Scrapes a claimed connection and acks or requeues its lease.
+        :return: Outcome of the visit ('success', 'empty', 'retry', 'timeout' or the kind of block).
+        """
+        started = time.perf_counter()
+        try:
+            person = self.gather_contact_info(lease.profile, show_terminal=self.show_terminal)
+        except TimeoutException:
+            # A page that does not load is retried once and then left for the next run
+            retry = lease.profile not in self._timed_out
+            self._timed_out.add(lease.profile)
+            queue.nack(lease, requeue=retry)
+            self.metrics.increment("timeouts")
+            return "timeout"
+        except Exception:
+            queue.nack(lease)
+            self.metrics.increment("errors")
+            raise
+
+        # Throttle and checkpoint pages, and empty extractions, go back to the queue instead of being stored
+        block = detect_block(self.driver.current_url)
+        if block:
+            queue.nack(lease)
+            self.scheduler.record_block(block)
+            self.metrics.increment("blocks")
+            self.metrics.increment("retries")
+            return block
+        if not person.name and self.scheduler.retry_empty(lease.profile):
+            queue.nack(lease)
+            self.metrics.increment("retries")
+            return "retry"
+
+        # Only a profile with data is a success: an empty one must not reset the empty streak or raise the rate
+        if person.name:
+            self.scheduler.record_success(time.perf_counter() - started)
+        with self.metrics.span("storage"):
+            queue.ack(lease, person.to_dict())
+        # Empty extractions are counted once, when they are stored after their retry
+        if not person.name:
+            self.metrics.increment("empty_extractions")
+            return "empty"
+        self.metrics.increment("successes")
+        return "success"
 
     def get_connections_links(self) -> list[str]:
-        links = []
-        connections_list = self.driver.find_elements(By.CLASS_NAME, "mn-connection-card__details")
-        for connection in connections_list:
-            link = connection.find_element(By.TAG_NAME, "a").get_attribute("href")
-            links.append(link)
-        return links
+        links = self.driver.execute_script(self.CARD_LINKS_SCRIPT, f".{self.CONNECTION_CARD_CLASS}", 0)
+        return [link for link in links if link]
 
     def _go_to(self, url: str):
-        self.driver.get(url)
-        self._wait_for_page_load()
+        with self.metrics.span("navigation"):
+            self.driver.get(url)
+        with self.metrics.span("wait"):
+            self.waiter.wait(self.driver, 'contact_info', contact_info_ready)
+        if self.lean:
+            log_page_traffic(self.driver, url)
 
     def _connection_link_contact_info(self, connection_link: str) -> str:
-        return f"{connection_link}overlay/contact-info/"
-
-    def _wait_for_page_load(self, timeout: int = 10):
-        WebDriverWait(self.driver, timeout).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
-
-    def _scroll_to_end(self, times: int = 20):
-        for _ in range(times):
-            scroll_to_end(self.driver, times=times)
-            try:
-                self.driver.find_element(By.CSS_SELECTOR, "div.p5").click()
-            except NoSuchElementException:
-                pass
\ No newline at end of file
+        return f"{connection_link}overlay/contact-info/"
\ No newline at end of file
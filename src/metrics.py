@@ -0,0 +1,152 @@
+import bisect
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+METRICS_PREFIX = "linkedin_scraper"
+
+
+def metrics_paths_for(file_path) -> tuple:
+    """
+    Returns the paths of the JSON summary and the Prometheus textfile stored next to a connections file.
+    """
+    file_path = Path(file_path)
+    return file_path.with_suffix(".metrics.json"), file_path.with_suffix(".prom")
+
+
+class Histogram:
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS, window: int = 500):
+        """
+        Latency histogram with cumulative buckets for Prometheus and a rolling window for percentiles.
+        :param buckets: Upper bounds of the buckets in seconds.
+        :param window: Number of recent observations kept for the percentiles.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self.recent = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+        self.recent.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        if not self.recent:
+            return 0.0
+        ordered = sorted(self.recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "p50": self.percentile(0.5),
+            "p95": self.percentile(0.95),
+            "max": self.max,
+        }
+
+
+class Metrics:
+    def __init__(self, trace_limit: int = 1000, window: int = 500):
+        """
+        Timing spans, latency histograms, counters and per-profile traces of the scrape pipeline.
+        Recording a span costs two clock reads and a locked update, so it can stay on in every run.
+        :param trace_limit: Number of most recent profile traces kept.
+        :param window: Number of recent observations per stage used for the percentiles.
+        """
+        self.window = window
+        self.histograms = {}
+        self.counters = {}
+        self.traces = deque(maxlen=trace_limit)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str):
+        """
+        Times a pipeline stage ('navigation', 'wait', 'extraction', 'storage', ...).
+        The time is added to the stage histogram and to the trace of the profile being scraped, if any.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, time.perf_counter() - started)
+
+    def observe(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = Histogram(window=self.window)
+            histogram.observe(seconds)
+        trace = getattr(self._local, "trace", None)
+        if trace is not None:
+            trace["stages"][stage] = trace["stages"].get(stage, 0.0) + seconds
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    @contextmanager
+    def trace(self, profile: str):
+        """
+        Collects the spans recorded by the current thread while a profile is scraped.
+        Yields the trace, whose 'outcome' the caller can set.
+        """
+        trace = {"profile": profile, "started_at": time.time(), "stages": {}, "outcome": "error"}
+        self._local.trace = trace
+        started = time.perf_counter()
+        try:
+            yield trace
+        finally:
+            self._local.trace = None
+            trace["total"] = time.perf_counter() - started
+            with self._lock:
+                self.traces.append(trace)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "counters": dict(self.counters),
+                "stages": {stage: histogram.summary() for stage, histogram in self.histograms.items()},
+                "traces": list(self.traces),
+            }
+
+    def export_json(self, file_path) -> None:
+        with open(file_path, "w", encoding='utf-8') as file:
+            json.dump(self.summary(), file, ensure_ascii=False, indent=2)
+
+    def export_prometheus(self, file_path) -> None:
+        """
+        Writes the counters and histograms in the Prometheus text format, for the node_exporter textfile collector.
+        The file is replaced atomically so the collector never reads it half written.
+        """
+        lines = []
+        with self._lock:
+            for counter, value in sorted(self.counters.items()):
+                name = f"{METRICS_PREFIX}_{counter}_total"
+                lines += [f"# TYPE {name} counter", f"{name} {value}"]
+            name = f"{METRICS_PREFIX}_stage_seconds"
+            lines.append(f"# TYPE {name} histogram")
+            for stage, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ("+Inf",), histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{stage="{stage}",le="{bound}"}} {cumulative}')
+                lines.append(f'{name}_sum{{stage="{stage}"}} {histogram.sum}')
+                lines.append(f'{name}_count{{stage="{stage}"}} {histogram.count}')
+
+        tmp_path = Path(f"{file_path}.tmp")
+        with open(tmp_path, "w", encoding='utf-8') as file:
+            file.write("\n".join(lines) + "\n")
+        tmp_path.replace(file_path)
\ No newline at end of file
@@ -0,0 +1,271 @@
+import re
+
+
+def clean_location(location):
+    """
+    Splits a LinkedIn location ('City, Region, Country') into its three parts.
+    :param location: Location text of a profile.
+    :return: Dictionary with the city, region and country (None when missing).
+    """
+    if location:
+        parts = location.split(", ")
+        return {
+            "city": parts[0] if len(parts) > 0 else None,
+            "region": parts[1] if len(parts) > 1 else None,
+            "country": parts[2] if len(parts) > 2 else None,
+        }
+    return {"city": None, "region": None, "country": None}
+
+
+EMOJIS_AND_SYMBOLS = r'[\U00010000-\U0010FFFF]|[\*#@&<>\\/|]'
+
+TITLE_SYNONYMS = {
+    "es": {
+        "Estudiante": ["Alumno", "Aprendiz"],
+        "Universidad": ["Uni", "Facultad"],
+        "Ingeniero": ["Engineer", "Eng."],
+        "Desarrollador": ["Developer", "Dev"]
+    },
+    "en": {
+        "Student": ["Learner", "Pupil"],
+        "University": ["College", "Faculty"],
+        "Engineer": ["Ingeniero", "Eng."],
+        "Developer": ["Desarrollador", "Dev"]
+    }
+}
+
+
+def remove_emojis_and_symbols(text):
+    """
+    Removes emojis and special symbols from a text.
+    """
+    if text:
+        return re.sub(EMOJIS_AND_SYMBOLS, '', text)
+    return text
+
+
+class TitleNormalizer:
+    """
+    Cleans the titles of a language: removes emojis and symbols, then replaces synonyms.
+    Synonyms are matched after the symbols are gone, so 'Dev@Google' stays 'DevGoogle' as one word.
+    """
+
+    def __init__(self, language="es", synonyms=TITLE_SYNONYMS):
+        """
+        :param language: Language of the synonyms.
+        :param synonyms: Dictionary language -> {normalized term: [synonyms]}.
+        """
+        self.language = language
+        # Lowercase synonym -> normalized term
+        self._replacements = {}
+        for key, values in synonyms.get(language, {}).items():
+            for value in values:
+                self._replacements.setdefault(value.lower(), key)
+
+        # The | separator is kept to split the title; every other symbol is removed
+        self._symbols = re.compile(rf"(?!\|)(?:{EMOJIS_AND_SYMBOLS})")
+        self._synonyms = None
+        if self._replacements:
+            words = "|".join(re.escape(word) for word in sorted(self._replacements, key=len, reverse=True))
+            self._synonyms = re.compile(rf"(?<!\w)(?:{words})(?!\w)", re.IGNORECASE)
+
+    def _replace(self, match):
+        return self._replacements[match.group(0).lower()]
+
+    def normalize(self, title):
+        """
+        Returns the cleaned parts of a title, split on |.
+        """
+        if not title:
+            return []
+        title = self._symbols.sub("", title)
+        if self._synonyms:
+            title = self._synonyms.sub(self._replace, title)
+        parts = (part.strip() for part in title.split("|"))
+        return [part for part in parts if part]
+
+    def normalize_many(self, titles):
+        """
+        Cleans a list of titles.
+        """
+        return [self.normalize(title) for title in titles]
+
+
+title_normalizers = {}
+
+
+def get_title_normalizer(language="es"):
+    """
+    Returns the TitleNormalizer of a language, creating it only the first time.
+    """
+    if language not in title_normalizers:
+        title_normalizers[language] = TitleNormalizer(language)
+    return title_normalizers[language]
+
+
+def clean_title(title, language="es"):
+    """
+    Cleans a profile title, handling separators, synonyms and language.
+    :return: Cleaned parts of the title.
+    """
+    return get_title_normalizer(language).normalize(title)
+
+
+def extract_keywords(title):
+    """
+    Extracts the distinct keywords of a title.
+    """
+    if title:
+        keywords = re.findall(r"\b[A-Za-z0-9]+\b", title)
+        return list(set(keywords))
+    return []
+
+
+TITLE_CATEGORIES = {
+    "Data Science": [
+        "Data", "Machine Learning", "ETL", "Power BI", "Analytics", "Pandas", "AI", "Deep Learning", 
+        "Big Data", "Analista de Datos", "Ciencia de Datos", "Inteligencia Artificial", "Análisis Predictivo"
+    ],
+    "Engineering": [
+        "Engineer", "Desarrollador", "Developer", "Backend", "Frontend", "Software", "Fullstack", 
+        "Cloud", "Arquitecto de Software", "Ingeniero", "DevOps", "Cloud Engineer"
+    ],
+    "Programming Languages": [
+        "Python", "JavaScript", "Java", "C#", "C++", "Ruby", "PHP", "Go", "Swift", "Kotlin", 
+        "TypeScript", "SQL", "Perl", "Rust", "Matlab", "Scala", "Lenguajes de Programación", 
+        "Desarrollador Python", "Programador Java"
+    ],
+    "Cybersecurity": [
+        "Cybersecurity", "Pentesting", "SOC", "Blue Team", "Red Team", "Incident Response", 
+        "Threat", "SIEM", "MITRE", "Ciberseguridad", "Seguridad Informática", "Analista de Seguridad", 
+        "Hacking Ético", "Ethical Hacking", "Auditor de Seguridad"
+    ],
+    "Marketing": [
+        "SEO", "Marketing", "Content", "Social Media", "Growth", "Advertising", "Brand", 
+        "Digital", "Publicidad", "Mercadeo", "Estrategia de Marca", "Marketing Digital"
+    ],
+    "Operations": [
+        "Operations", "Supply Chain", "Logistics", "Project Management", "Process Improvement", 
+        "Operaciones", "Cadena de Suministro", "Logística", "Gestión de Proyectos", "Mejora de Procesos"
+    ],
+    "Human Resources": [
+        "HR", "Talent", "Recruitment", "People", "Payroll", "Employee", "Recursos Humanos", 
+        "Gestión de Talento", "Selección", "Gestión de Personas"
+    ],
+    "Finance": [
+        "Finance", "Financial", "Accounting", "Auditor", "Investment", "Banking", "Treasury", 
+        "Finanzas", "Contabilidad", "Auditoría", "Inversiones", "Banca", "Asesor Financiero"
+    ],
+    "Education": [
+        "Teacher", "Professor", "Educator", "Trainer", "Learning", "Instructor", "Docente", 
+        "Profesor", "Educador", "Formador", "Tutor", "Catedrático", "Maestro", "Coach Educativo", 
+        "Pedagogo", "Capacitación", "Entrenador de Habilidades"
+    ],
+    "Health": [
+        "Healthcare", "Doctor", "Nurse", "Therapist", "Pharmacist", "Medical", "Salud", 
+        "Médico", "Enfermero", "Terapeuta", "Farmacéutico", "Psiquiatra", "Fisioterapeuta"
+    ],
+    "Legal": [
+        "Lawyer", "Attorney", "Legal", "Compliance", "Contract", "Abogado", "Jurídico", 
+        "Cumplimiento", "Contrato", "Consultor Legal"
+    ],
+    "Creative": [
+        "Designer", "Illustrator", "Photographer", "Videographer", "Art", "Creative", 
+        "Diseñador", "Ilustrador", "Fotógrafo", "Videógrafo", "Arte", "Creativo", "Animador 3D", 
+        "Diseñador UI/UX"
+    ],
+    "Sales": [
+        "Sales", "Business Development", "Account Manager", "Customer", "Lead Generation", 
+        "Ventas", "Desarrollo de Negocios", "Gestión de Cuentas", "Representante de Ventas"
+    ],
+    "IT Support": [
+        "IT Support", "Helpdesk", "Service Desk", "Technical Support", "System Admin", 
+        "Soporte IT", "Informatico", "Administrador de Sistemas", "Soporte Técnico"
+    ],
+    "Manufacturing": [
+        "Production", "Manufacturing", "Factory", "Operations", "Quality Control", 
+        "Producción", "Fábrica", "Operaciones", "Control de Calidad", "Gestión de Producción"
+    ],
+    "Consulting": [
+        "Consultant", "Advisory", "Strategy", "Business Analysis", "Consultoría", 
+        "Estrategia", "Análisis de Negocios", "Asesor"
+    ],
+    "Freelance/Independent": [
+        "Freelance", "Self-employed", "Independent", "Autónomo", "Independiente", 
+        "Consultor Independiente"
+    ],
+    "Customer Service": [
+        "Customer Service", "Support Specialist", "Atención al Cliente", 
+        "Especialista en Soporte", "Soporte al Cliente"
+    ],
+    "Public Sector": [
+        "Public Sector", "Government", "Nonprofit", "Sector Público", 
+        "Gobierno", "Organización sin Fines de Lucro", "ONG"
+    ],
+    "Entrepreneurship": [
+        "Entrepreneur", "Startup", "Founder", "Co-Founder", "Emprendimiento", 
+        "Empresario", "Startup", "Fundador"
+    ],
+    "Agriculture": [
+        "Agriculture", "Farming", "Agronomist", "Agricultura", "Granja", "Agrónomo"
+    ],
+    "Other": [] 
+}
+
+
+class TitleClassifier:
+    """
+    Classifies titles into categories with a single regular expression compiled once.
+    """
+
+    def __init__(self, categories=TITLE_CATEGORIES, default="Other"):
+        """
+        :param categories: Dictionary category -> keywords, in order of priority.
+        :param default: Category of the titles without any keyword.
+        """
+        self.categories = list(categories)
+        self.default = default
+        # Lowercase keyword -> position of the first category that contains it
+        self._priority = {}
+        for position, keywords in enumerate(categories.values()):
+            for keyword in keywords:
+                self._priority.setdefault(keyword.lower(), position)
+
+        # Alternatives are grouped by their first character and sorted by priority within each group,
+        # so at every position of the title the match is the keyword with the highest priority
+        groups = {}
+        for keyword in sorted(self._priority, key=self._priority.get):
+            groups.setdefault(keyword[0], []).append(re.escape(keyword[1:]))
+        alternatives = "|".join(f"{re.escape(first)}(?:{'|'.join(rests)})" for first, rests in groups.items())
+        self._pattern = re.compile(f"(?=({alternatives}))")
+
+    def classify(self, title):
+        """
+        Returns the first category (in order of priority) with a keyword in the title.
+        """
+        if not title or not self._priority:
+            return self.default
+        best = None
+        for match in self._pattern.finditer(title.lower()):
+            position = self._priority[match.group(1)]
+            if best is None or position < best:
+                best = position
+                if best == 0:
+                    break
+        return self.categories[best] if best is not None else self.default
+
+    def classify_many(self, titles):
+        """
+        Classifies a list of titles.
+        """
+        return [self.classify(title) for title in titles]
+
+
+title_classifier = TitleClassifier()
+
+
+def classify_title(title):
+    """
+    Classifies a title into the predefined TITLE_CATEGORIES.
+    """
+    return title_classifier.classify(title)
@@ -0,0 +1,108 @@
+import threading
+import time
+
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from src.metrics import Histogram
+from src.person import Person
+from src.utils import printred, printyellow
+
+WAIT_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+# True when an element matching the selector is in the DOM (and has text, if required)
+ELEMENT_READY_SCRIPT = """
+    const [selector, withText] = arguments;
+    const element = document.querySelector(selector);
+    return !!element && (!withText || element.innerText.trim() !== '');
+"""
+
+
+def element_ready(selector: str, with_text: bool = False):
+    """
+    Builds a readiness predicate that holds once an element matching a CSS selector is rendered.
+    :param selector: CSS selector of the element the extractor needs.
+    :param with_text: Whether the element must also have text.
+    :return: Predicate taking the driver, usable with WebDriverWait.
+    """
+    return lambda driver: driver.execute_script(ELEMENT_READY_SCRIPT, selector, with_text)
+
+
+def document_ready(driver) -> bool:
+    return driver.execute_script('return document.readyState') == 'complete'
+
+
+# Name heading of the contact-info overlay, rendered together with the contact sections
+contact_info_ready = element_ready(f'#{Person.NAME_ID}', with_text=True)
+# Share box or first update of the feed, present whatever the UI language
+feed_ready = element_ready('.share-box-feed-entry__trigger, .feed-shared-update-v2')
+
+
+def connection_cards_ready(card_selector: str):
+    return element_ready(card_selector)
+
+
+class PageWaiter:
+    def __init__(self, timeout: float = WAIT_TIMEOUT, poll_interval: float = POLL_INTERVAL):
+        """
+        Waits for the content each page's extractor needs instead of the whole document, and records
+        how long every wait took in a fixed-size Histogram per page. It is thread-safe, so the workers
+        of a BrowserPool can share it.
+        :param timeout: Default seconds to wait before giving up.
+        :param poll_interval: Seconds between checks of the readiness predicate.
+        """
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.timings = {}
+        self.timeouts = {}
+        self._lock = threading.Lock()
+
+    def wait(self, driver, page: str, predicate=document_ready, timeout: float = None) -> bool:
+        """
+        Waits until a page is ready for extraction.
+        :param driver: WebDriver showing the page.
+        :param page: Name the wait is recorded under (e.g. 'contact_info').
+        :param predicate: Readiness predicate taking the driver.
+        :param timeout: Seconds to wait; defaults to the waiter's timeout.
+        :return: True if the page got ready, False if the wait timed out.
+        """
+        started = time.perf_counter()
+        try:
+            # A predicate that runs while the page is navigating fails with a JavascriptException: poll again
+            WebDriverWait(driver, timeout or self.timeout, poll_frequency=self.poll_interval,
+                          ignored_exceptions=(JavascriptException,)).until(predicate)
+            ready = True
+        except TimeoutException:
+            printred(f"Timed out waiting for the {page} page.")
+            ready = False
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            histogram = self.timings.get(page)
+            if histogram is None:
+                histogram = self.timings[page] = Histogram()
+            histogram.observe(elapsed)
+            if not ready:
+                self.timeouts[page] = self.timeouts.get(page, 0) + 1
+        return ready
+
+    def stats(self) -> dict:
+        """
+        :return: Number of waits, timeouts, mean and max seconds waited for each page.
+        """
+        with self._lock:
+            return {
+                page: {
+                    "waits": histogram.count,
+                    "timeouts": self.timeouts.get(page, 0),
+                    "mean": histogram.sum / histogram.count,
+                    "max": histogram.max,
+                }
+                for page, histogram in self.timings.items()
+            }
+
+    def report(self) -> None:
+        for page, stats in self.stats().items():
+            printyellow(f"Waited for {page} {stats['waits']} times: mean {stats['mean']:.2f}s, "
+                        f"max {stats['max']:.2f}s, {stats['timeouts']} timeouts.")
\ No newline at end of file
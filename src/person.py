@@ -1,10 +1,64 @@
+from concurrent.futures import ProcessPoolExecutor
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from typing import Optional, Dict
 
+
+def _class_xpath(class_name: str, relative: bool = False) -> str:
+    """
+    Builds the XPath equivalent of a By.CLASS_NAME selector, including compound ones like 'a.b'.
+    """
+    conditions = " and ".join(f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+                              for name in class_name.split('.'))
+    return f"{'.' if relative else ''}//*[{conditions}]"
+
+
+def _html_text(element) -> str:
+    return element.text_content().strip() if element is not None else ""
+
 class Person:
     # Constants for reusable class names or tags
     CONTACT_TYPE_CLASS = 'pv-contact-info__contact-type'
+    NAME_ID = 'pv-contact-info'
+    PROFILE_LIST_CLASS = 'pv-top-card--list'
+    WEBSITE_CLASS = 'pv-contact-info__contact-link'
+    TITLE_CLASS = 'text-body-medium.break-words'
+    LOCATION_CLASS = 'text-body-small.inline.t-black--light.break-words'
+    PHOTO_CLASS = 'pv-top-card-profile-picture__container'
+    # Field -> (h3 text, tag holding the value) of the contact-type sections
+    CONTACT_SECTIONS = {
+        'phone': ('Phone', 'span'),
+        'email': ('Email', 'a'),
+        'birthday': ('Birthday', 'span'),
+        'address': ('Address', 'span'),
+    }
+
+    # Extracts every field in a single WebDriver round-trip, with the same selectors as the gather_* methods
+    EXTRACT_ALL_SCRIPT = """
+        const [selectors, sections, includeProfile] = arguments;
+        const find = (className) => document.querySelector('.' + className);
+        const text = (element) => element ? element.innerText.trim() : '';
+        const source = (element) => element ? element.src || element.getAttribute('src') || '' : '';
+        const fields = {
+            name: text(document.getElementById(selectors.name)),
+            website: text(find(selectors.website)),
+            title: text(find(selectors.title)),
+            location: text(find(selectors.location)),
+            photo: source(find(selectors.photo)),
+        };
+        const contactSections = Array.from(document.getElementsByClassName(selectors.contactType));
+        for (const [field, [h3Text, tag]] of Object.entries(sections)) {
+            const section = contactSections.find((s) => text(s.querySelector('h3')) === h3Text);
+            fields[field] = section ? text(section.querySelector(tag)) : '';
+        }
+        if (includeProfile) {
+            const list = find(selectors.profileList);
+            const item = list ? list.querySelector('li') : null;
+            const link = item ? item.querySelector('a') : null;
+            fields.profile = link ? link.href : '';
+        }
+        return fields;
+    """
 
     def __init__(self, driver: Optional[WebDriver] = None):
         """
@@ -56,11 +110,11 @@ class Person:
         return ""
 
     def gather_name(self):
-        self.name = self._safe_find_element(By.ID, 'pv-contact-info')
+        self.name = self._safe_find_element(By.ID, self.NAME_ID)
 
     def gather_profile(self):
         try:
-            profile_element = self.driver.find_element(By.CLASS_NAME, 'pv-top-card--list')
+            profile_element = self.driver.find_element(By.CLASS_NAME, self.PROFILE_LIST_CLASS)
             self.profile = profile_element.find_element(By.TAG_NAME, 'li').find_element(By.TAG_NAME, 'a').get_attribute('href')
         except Exception:
             self.profile = ""
@@ -69,35 +123,111 @@ class Person:
         self.profile = profile
 
     def gather_website(self):
-        self.website = self._safe_find_element(By.CLASS_NAME, 'pv-contact-info__contact-link')
+        self.website = self._safe_find_element(By.CLASS_NAME, self.WEBSITE_CLASS)
 
     def gather_phone(self):
-        self.phone = self._get_section_value(self.CONTACT_TYPE_CLASS, 'Phone')
+        self.phone = self._get_section_value(self.CONTACT_TYPE_CLASS, *self.CONTACT_SECTIONS['phone'])
 
     def gather_email(self):
-        self.email = self._get_section_value(self.CONTACT_TYPE_CLASS, 'Email', tag='a')
+        self.email = self._get_section_value(self.CONTACT_TYPE_CLASS, *self.CONTACT_SECTIONS['email'])
 
     def gather_birthday(self):
-        self.birthday = self._get_section_value(self.CONTACT_TYPE_CLASS, 'Birthday')
+        self.birthday = self._get_section_value(self.CONTACT_TYPE_CLASS, *self.CONTACT_SECTIONS['birthday'])
 
     def gather_address(self):
-        self.address = self._get_section_value(self.CONTACT_TYPE_CLASS, 'Address')
+        self.address = self._get_section_value(self.CONTACT_TYPE_CLASS, *self.CONTACT_SECTIONS['address'])
 
     def gather_title(self):
-        self.title = self._safe_find_element(By.CLASS_NAME, 'text-body-medium.break-words')
+        self.title = self._safe_find_element(By.CLASS_NAME, self.TITLE_CLASS)
 
     def gather_location(self):
-        self.location = self._safe_find_element(By.CLASS_NAME, 'text-body-small.inline.t-black--light.break-words')
+        self.location = self._safe_find_element(By.CLASS_NAME, self.LOCATION_CLASS)
 
     def gather_photo(self):
-        self.photo = self._safe_find_element(By.CLASS_NAME, 'pv-top-card-profile-picture__container', attribute='src')
+        self.photo = self._safe_find_element(By.CLASS_NAME, self.PHOTO_CLASS, attribute='src')
+
+    def gather_all_info_at_once(self, include_profile: bool = False) -> bool:
+        """
+        Gathers all available information with a single script executed in the browser.
+        :param include_profile: Whether to gather profile URL.
+        :return: True if the script succeeded, False if the fields must be gathered one by one.
+        """
+        selectors = {
+            'name': self.NAME_ID,
+            'profileList': self.PROFILE_LIST_CLASS,
+            'website': self.WEBSITE_CLASS,
+            'title': self.TITLE_CLASS,
+            'location': self.LOCATION_CLASS,
+            'photo': self.PHOTO_CLASS,
+            'contactType': self.CONTACT_TYPE_CLASS,
+        }
+        try:
+            fields = self.driver.execute_script(self.EXTRACT_ALL_SCRIPT, selectors, self.CONTACT_SECTIONS, include_profile)
+        except Exception:
+            return False
+        if not isinstance(fields, dict):
+            return False
+
+        for field, value in fields.items():
+            setattr(self, field, value or "")
+        return True
+
+    @classmethod
+    def from_html(cls, html: str, profile: str = "", include_profile: bool = False) -> "Person":
+        """
+        Builds a Person from the HTML of a contact-info page, with the same selectors as the gather_* methods.
+        Needs no browser, so saved pages can be parsed again later or in another process.
+        :param html: Page source of the contact-info page.
+        :param profile: Profile URL to set on the person.
+        :param include_profile: Whether to take the profile URL from the page instead.
+        :return: The new Person instance.
+        """
+        try:
+            from lxml import html as lxml_html
+        except ImportError:
+            raise ImportError("Parsing HTML pages requires lxml. Install it with 'pip install lxml'.")
+
+        document = lxml_html.fromstring(html)
+
+        def first(xpath: str, context=document):
+            elements = context.xpath(xpath)
+            return elements[0] if elements else None
+
+        person = cls()
+        person.profile = profile
+        person.name = _html_text(first(f"//*[@id='{cls.NAME_ID}']"))
+        person.website = _html_text(first(_class_xpath(cls.WEBSITE_CLASS)))
+        person.title = _html_text(first(_class_xpath(cls.TITLE_CLASS)))
+        person.location = _html_text(first(_class_xpath(cls.LOCATION_CLASS)))
+        photo = first(_class_xpath(cls.PHOTO_CLASS))
+        person.photo = photo.get('src', "") if photo is not None else ""
+
+        sections = document.xpath(_class_xpath(cls.CONTACT_TYPE_CLASS))
+        for field, (h3_text, tag) in cls.CONTACT_SECTIONS.items():
+            for section in sections:
+                if _html_text(first('.//h3', section)) == h3_text:
+                    setattr(person, field, _html_text(first(f'.//{tag}', section)))
+                    break
 
-    def gather_all_info(self, include_profile: bool = False) -> "Person":
+        if include_profile:
+            profile_list = first(_class_xpath(cls.PROFILE_LIST_CLASS))
+            item = first('.//li', profile_list) if profile_list is not None else None
+            link = first('.//a', item) if item is not None else None
+            person.profile = link.get('href', "") if link is not None else ""
+
+        return person
+
+    def gather_all_info(self, include_profile: bool = False, single_call: bool = True) -> "Person":
         """
         Gathers all available information for the person.
         :param include_profile: Whether to gather profile URL.
+        :param single_call: Whether to extract every field with one script, falling back to the
+                            per-field methods if the script fails.
         :return: The updated Person instance.
         """
+        if single_call and self.gather_all_info_at_once(include_profile):
+            return self
+
         self.gather_name()
         if include_profile:
             self.gather_profile()
@@ -129,3 +259,19 @@ class Person:
             "website": self.website,
             "photo": self.photo
         }
+
+
+def _person_dict_from_html(page: tuple) -> Dict[str, str]:
+    html, profile = page
+    return Person.from_html(html, profile).to_dict()
+
+
+def persons_from_html(pages: list, processes: Optional[int] = None) -> list:
+    """
+    Parses many saved contact-info pages in a process pool.
+    :param pages: List of (html, profile) tuples.
+    :param processes: Number of worker processes; defaults to the number of CPUs.
+    :return: List of person dictionaries, in the same order as the pages.
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return list(executor.map(_person_dict_from_html, pages, chunksize=16))
@@ -0,0 +1,208 @@
+import threading
+import time
+from urllib.parse import urlsplit
+
+from src.utils import printred, printyellow
+
+# Path prefixes of the pages LinkedIn shows instead of a profile when it throttles or challenges the account
+BLOCK_PATH_PREFIXES = {
+    "/checkpoint/": "checkpoint",
+    "/authwall": "authwall",
+    "/uas/login": "login",
+    "/login": "login",
+}
+# Blocks that mean the session was logged out: pausing cannot help, the run stops and has to log in again
+SESSION_BLOCKS = ("login", "authwall")
+
+
+class RateLimitError(Exception):
+    pass
+
+
+class SessionExpiredError(RateLimitError):
+    pass
+
+
+def detect_block(url: str):
+    """
+    Detects throttle, checkpoint and login pages from the path of the URL the browser ended up on.
+    Only whole leading path segments match, so a profile like '/in/loginov/' is not a login page.
+    :param url: Current URL of the browser.
+    :return: Kind of block ('checkpoint', 'authwall' or 'login'), or None if the page is not blocked.
+    """
+    path = urlsplit(url).path.rstrip("/") + "/"
+    for prefix, kind in BLOCK_PATH_PREFIXES.items():
+        if path.startswith(prefix.rstrip("/") + "/"):
+            return kind
+    return None
+
+
+class RateScheduler:
+    def __init__(self, rate_per_hour: float = 600, max_rate_per_hour: float = 1800, min_rate_per_hour: float = 60,
+                 burst: int = 3, slow_latency_factor: float = 2.0, pause_seconds: float = 300,
+                 max_pause_seconds: float = 3600, max_blocks: int = 6, empty_streak: int = 3,
+                 clock=time.monotonic, sleep=time.sleep):
+        """
+        Token bucket that paces profile visits across every browser worker and adapts its rate.
+        The rate grows additively while pages load at their usual latency and is cut in half when pages get
+        slow, when a throttle or checkpoint page shows up or when several extractions in a row come back empty.
+        Blocks also pause every worker, for twice as long on each consecutive block up to max_pause_seconds,
+        and after max_blocks consecutive blocks the scheduler gives up: acquire() raises RateLimitError.
+        A login or authwall page stops the run at once: acquire() raises SessionExpiredError.
+        :param rate_per_hour: Initial number of profile visits per hour.
+        :param max_rate_per_hour: Highest rate the scheduler ramps up to.
+        :param min_rate_per_hour: Lowest rate the scheduler slows down to.
+        :param burst: Number of visits that can be made back to back after an idle period.
+        :param slow_latency_factor: Latency, relative to the fastest average seen, above which pages count as slow.
+        :param pause_seconds: Seconds every worker pauses after the first throttle or checkpoint page.
+        :param max_pause_seconds: Longest pause, however many blocks in a row there were.
+        :param max_blocks: Number of consecutive blocks (without a successful profile in between) after which
+                           the run stops.
+        :param empty_streak: Number of consecutive empty extractions that counts as throttling.
+        :param clock: Monotonic clock.
+        :param sleep: Function used to wait for tokens.
+        """
+        self.rate_per_hour = rate_per_hour
+        self.max_rate_per_hour = max_rate_per_hour
+        self.min_rate_per_hour = min_rate_per_hour
+        self.burst = burst
+        self.slow_latency_factor = slow_latency_factor
+        self.pause_seconds = pause_seconds
+        self.max_pause_seconds = max_pause_seconds
+        self.max_blocks = max_blocks
+        self.empty_streak = empty_streak
+        self.clock = clock
+        self.sleep = sleep
+
+        self._tokens = 1.0
+        self._refilled_at = clock()
+        self._paused_until = 0.0
+        self._block_streak = 0
+        # Error raised by acquire() once the scheduler gave up (max_blocks consecutive blocks or a lost session)
+        self._gave_up = None
+        self._empty_streak = 0
+        self._retried = set()
+        self._latency = None
+        self._best_latency = None
+        self._started_at = None
+        self.completed = 0
+        self.blocks = {}
+        self.empties = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Blocks until the next profile visit is allowed.
+        :raises RateLimitError: If LinkedIn kept blocking the scraper and the run has to stop.
+        """
+        while True:
+            with self._lock:
+                if self._gave_up:
+                    raise self._gave_up
+                now = self.clock()
+                if self._started_at is None:
+                    self._started_at = now
+                self._refill(now)
+                if now < self._paused_until:
+                    wait = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                else:
+                    wait = (1 - self._tokens) * 3600 / self.rate_per_hour
+            self.sleep(wait)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._refilled_at) * self.rate_per_hour / 3600)
+        self._refilled_at = now
+
+    def record_success(self, latency: float) -> None:
+        """
+        Records a profile extracted successfully (not an empty extraction) and adapts the rate to its latency.
+        :param latency: Seconds it took to load the profile and extract its data.
+        """
+        with self._lock:
+            self.completed += 1
+            self._block_streak = 0
+            self._empty_streak = 0
+            self._latency = latency if self._latency is None else 0.8 * self._latency + 0.2 * latency
+            self._best_latency = min(self._best_latency or self._latency, self._latency)
+            if self._latency > self.slow_latency_factor * self._best_latency:
+                self._set_rate(self.rate_per_hour * 0.9)
+            else:
+                self._set_rate(self.rate_per_hour + self.max_rate_per_hour * 0.01)
+
+    def record_block(self, kind: str) -> None:
+        """
+        Records a throttle or checkpoint page: halves the rate and pauses every worker.
+        Blocks seen by other workers during the pause are part of the same block.
+        A login or authwall page means the session was logged out, so the run stops instead of pausing.
+        :param kind: Kind of block returned by detect_block.
+        """
+        with self._lock:
+            self.blocks[kind] = self.blocks.get(kind, 0) + 1
+            if kind in SESSION_BLOCKS:
+                if not self._gave_up:
+                    self._gave_up = SessionExpiredError(
+                        f"LinkedIn redirected a profile to the {kind} page: the session was logged out. "
+                        f"Stopping the run; run it again to log in.")
+                    printred(str(self._gave_up))
+                return
+            self._pause(kind)
+
+    def retry_empty(self, profile: str) -> bool:
+        """
+        Records an empty extraction. The profile is retried once, and a streak of empty extractions
+        is handled as throttling.
+        :param profile: Connection link whose extraction came back empty.
+        :return: True if the profile should be requeued, False if it is really empty and should be stored.
+        """
+        with self._lock:
+            self.empties += 1
+            self._empty_streak += 1
+            if self._empty_streak >= self.empty_streak:
+                self._empty_streak = 0
+                self._pause("empty extractions")
+            if profile in self._retried:
+                self._retried.discard(profile)
+                return False
+            self._retried.add(profile)
+            return True
+
+    def _pause(self, reason: str) -> None:
+        now = self.clock()
+        if self._gave_up or now < self._paused_until:
+            return
+        self._block_streak += 1
+        if self._block_streak >= self.max_blocks:
+            self._gave_up = RateLimitError(
+                f"LinkedIn blocked the scraper {self._block_streak} times in a row ({reason}). "
+                f"Stopping the run; try again later or with a lower rate_per_hour.")
+            self._paused_until = 0.0
+            printred(str(self._gave_up))
+            return
+        pause = min(self.max_pause_seconds, self.pause_seconds * 2 ** (self._block_streak - 1))
+        self._paused_until = now + pause
+        self._tokens = 0.0
+        self._refilled_at = self._paused_until
+        self._set_rate(self.rate_per_hour / 2)
+        printred(f"LinkedIn is limiting the scraper ({reason}). Pausing for {pause:.0f}s, "
+                 f"then continuing at {self.rate_per_hour:.0f} profiles/hour.")
+
+    def _set_rate(self, rate_per_hour: float) -> None:
+        self.rate_per_hour = max(self.min_rate_per_hour, min(self.max_rate_per_hour, rate_per_hour))
+
+    def profiles_per_hour(self) -> float:
+        """
+        :return: Effective number of profiles extracted per hour since the first visit.
+        """
+        with self._lock:
+            if self._started_at is None:
+                return 0.0
+            elapsed = self.clock() - self._started_at
+            return self.completed * 3600 / elapsed if elapsed > 0 else 0.0
+
+    def report(self) -> None:
+        blocks = ", ".join(f"{count} {kind}" for kind, count in self.blocks.items()) or "none"
+        printyellow(f"{self.completed} profiles at {self.profiles_per_hour():.0f} profiles/hour "
+                    f"(final rate {self.rate_per_hour:.0f}/hour). Blocks: {blocks}. Empty extractions: {self.empties}.")
\ No newline at end of file
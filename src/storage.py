@@ -0,0 +1,322 @@
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+COLLECTIONS = ("connections", "scraped_texts", "persons")
+
+
+def record_profile(record) -> str:
+    """
+    Returns the profile identifier of a stored record.
+    Connections and scraped texts are stored as plain links, persons as dictionaries.
+    :param record: Link string or person dictionary.
+    :return: Profile identifier of the record.
+    """
+    return record["profile"] if isinstance(record, dict) else record
+
+
+def empty_layout() -> dict:
+    return {collection: [] for collection in COLLECTIONS}
+
+
+class StorageBackend(ABC):
+    """
+    Persistence interface used by FileManager.
+    Records are grouped in the collections defined in COLLECTIONS and keyed by their profile.
+    """
+
+    @abstractmethod
+    def load(self) -> dict:
+        """
+        Returns every collection in the JSON layout: {"connections": [...], "scraped_texts": [...], "persons": [...]}.
+        """
+
+    @abstractmethod
+    def contains(self, collection: str, profile: str) -> bool:
+        pass
+
+    @abstractmethod
+    def all(self, collection: str) -> list:
+        pass
+
+    @abstractmethod
+    def first(self, collection: str):
+        """
+        Returns the oldest record of a collection, or None if it is empty.
+        """
+
+    @abstractmethod
+    def append(self, collection: str, records: list) -> None:
+        """
+        Appends records to a collection, ignoring profiles already present in it.
+        """
+
+    @abstractmethod
+    def move(self, profile: str, source: str, target: str) -> None:
+        """
+        Moves a record from one collection to the end of another one.
+        """
+
+    def complete(self, profile: str, person_data: dict) -> None:
+        """
+        Stores a scraped person and moves its link from 'connections' to 'scraped_texts' as one change.
+        """
+        self.append("persons", [person_data])
+        self.move(profile, "connections", "scraped_texts")
+
+    def close(self) -> None:
+        pass
+
+    def import_json(self, file_path) -> None:
+        """
+        Imports the records of a JSON file with the connections_links.json layout.
+        :param file_path: Path to the JSON file.
+        """
+        data = JsonBackend(file_path).load()
+        for collection in COLLECTIONS:
+            self.append(collection, data[collection])
+
+    def export_json(self, file_path) -> None:
+        """
+        Writes every collection to a JSON file with the connections_links.json layout.
+        :param file_path: Path to the JSON file.
+        """
+        with open(file_path, "w", encoding='utf-8') as file:
+            json.dump(self.load(), file, indent=4, ensure_ascii=False)
+
+
+class JsonBackend(StorageBackend):
+    """
+    Stores every collection in a single JSON file.
+    The file is read once when the backend is opened and rewritten on every change. In memory, each
+    collection is a profile -> record index in insertion order, so lookups, appends and moves never
+    scan the collections.
+    """
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self._data = self._load_json()
+        self._indexes = {collection: {record_profile(record): record for record in self._data[collection]}
+                         for collection in COLLECTIONS}
+
+    def _load_json(self) -> dict:
+        try:
+            with open(self.file_path, "r", encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            return empty_layout()
+        except json.JSONDecodeError:
+            raise ValueError("Invalid JSON format in the file.")
+        if not isinstance(data, dict):
+            raise ValueError("JSON data must be a dictionary.")
+        for collection in COLLECTIONS:
+            data.setdefault(collection, [])
+        return data
+
+    def _save_json(self) -> None:
+        with open(self.file_path, "w", encoding='utf-8') as file:
+            json.dump(self.load(), file, indent=4, ensure_ascii=False)
+
+    def load(self) -> dict:
+        for collection in COLLECTIONS:
+            self._data[collection] = list(self._indexes[collection].values())
+        return self._data
+
+    def contains(self, collection: str, profile: str) -> bool:
+        return profile in self._indexes[collection]
+
+    def all(self, collection: str) -> list:
+        return list(self._indexes[collection].values())
+
+    def first(self, collection: str):
+        return next(iter(self._indexes[collection].values()), None)
+
+    def append(self, collection: str, records: list) -> None:
+        index = self._indexes[collection]
+        added = False
+        for record in records:
+            profile = record_profile(record)
+            if profile not in index:
+                index[profile] = record
+                added = True
+        if added:
+            self._save_json()
+
+    def move(self, profile: str, source: str, target: str) -> None:
+        record = self._indexes[source].pop(profile, None)
+        if record is None:
+            return
+        self._indexes[target].setdefault(profile, record)
+        self._save_json()
+
+    def complete(self, profile: str, person_data: dict) -> None:
+        self._indexes["persons"].setdefault(record_profile(person_data), person_data)
+        record = self._indexes["connections"].pop(profile, None)
+        if record is not None:
+            self._indexes["scraped_texts"].setdefault(profile, record)
+        self._save_json()
+
+    def export_json(self, file_path) -> None:
+        if Path(file_path).resolve() != Path(self.file_path).resolve():
+            super().export_json(file_path)
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Stores every collection in an SQLite file indexed by profile.
+    Each change only touches the affected rows, so its cost does not depend on the size of the network.
+    The database is the source of truth while the scraper runs, and its JSON file is a copy written at
+    checkpoints and on close. The modification time of the JSON file is recorded on every sync, so a
+    JSON file edited outside the scraper is imported again the next time the database is opened.
+    """
+
+    def __init__(self, file_path, json_path=None):
+        """
+        :param file_path: Path to the SQLite file.
+        :param json_path: Path to the JSON file kept in sync with the database, if any.
+        """
+        self.file_path = file_path
+        self.json_path = json_path
+        self.connection = sqlite3.connect(str(file_path), check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "collection TEXT NOT NULL, "
+                "profile TEXT NOT NULL, "
+                "data TEXT NOT NULL, "
+                "UNIQUE (collection, profile))"
+            )
+            self.connection.execute("CREATE INDEX IF NOT EXISTS records_profile ON records (profile)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS records_order ON records (collection, id)")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS sync (key TEXT PRIMARY KEY, value REAL NOT NULL)")
+
+    def load(self) -> dict:
+        data = empty_layout()
+        rows = self.connection.execute("SELECT collection, data FROM records ORDER BY id")
+        for collection, record in rows:
+            data[collection].append(json.loads(record))
+        return data
+
+    def is_empty(self) -> bool:
+        return self.connection.execute("SELECT 1 FROM records LIMIT 1").fetchone() is None
+
+    def _synced_mtime(self):
+        row = self.connection.execute("SELECT value FROM sync WHERE key = 'json_mtime'").fetchone()
+        return row[0] if row else None
+
+    def _mark_synced(self) -> None:
+        with self.connection:
+            self.connection.execute("INSERT OR REPLACE INTO sync (key, value) VALUES ('json_mtime', ?)",
+                                    (os.stat(self.json_path).st_mtime,))
+
+    def sync_from_json(self) -> bool:
+        """
+        Replaces the records with the ones of the JSON file when the file changed after the last sync
+        (or the database is new), so edits made to the JSON file outside the scraper are not lost.
+        :return: True if the JSON file was imported.
+        """
+        if self.json_path is None or not Path(self.json_path).exists():
+            return False
+        synced = self._synced_mtime()
+        if synced is None and not self.is_empty():
+            # Database created before syncs were recorded: it is kept as it is
+            self._mark_synced()
+            return False
+        if synced is not None and os.stat(self.json_path).st_mtime <= synced and not self.is_empty():
+            return False
+        data = JsonBackend(self.json_path).load()
+        with self.connection:
+            self.connection.execute("DELETE FROM records")
+        for collection in COLLECTIONS:
+            self.append(collection, data[collection])
+        self._mark_synced()
+        return True
+
+    def contains(self, collection: str, profile: str) -> bool:
+        row = self.connection.execute(
+            "SELECT 1 FROM records WHERE collection = ? AND profile = ?", (collection, profile)
+        ).fetchone()
+        return row is not None
+
+    def all(self, collection: str) -> list:
+        rows = self.connection.execute("SELECT data FROM records WHERE collection = ? ORDER BY id", (collection,))
+        return [json.loads(record) for (record,) in rows]
+
+    def first(self, collection: str):
+        row = self.connection.execute(
+            "SELECT data FROM records WHERE collection = ? ORDER BY id LIMIT 1", (collection,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def append(self, collection: str, records: list) -> None:
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO records (collection, profile, data) VALUES (?, ?, ?)",
+                [(collection, record_profile(record), json.dumps(record, ensure_ascii=False)) for record in records]
+            )
+
+    def move(self, profile: str, source: str, target: str) -> None:
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT data FROM records WHERE collection = ? AND profile = ?", (source, profile)
+            ).fetchone()
+            if row is None:
+                return
+            self.connection.execute("DELETE FROM records WHERE collection = ? AND profile = ?", (source, profile))
+            self.connection.execute(
+                "INSERT OR IGNORE INTO records (collection, profile, data) VALUES (?, ?, ?)",
+                (target, profile, row[0])
+            )
+
+    def complete(self, profile: str, person_data: dict) -> None:
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR IGNORE INTO records (collection, profile, data) VALUES (?, ?, ?)",
+                ("persons", record_profile(person_data), json.dumps(person_data, ensure_ascii=False))
+            )
+            deleted = self.connection.execute(
+                "DELETE FROM records WHERE collection = 'connections' AND profile = ?", (profile,)
+            ).rowcount
+            if deleted:
+                self.connection.execute(
+                    "INSERT OR IGNORE INTO records (collection, profile, data) VALUES ('scraped_texts', ?, ?)",
+                    (profile, json.dumps(profile))
+                )
+
+    def export_json(self, file_path) -> None:
+        super().export_json(file_path)
+        if self.json_path is not None and Path(file_path).resolve() == Path(self.json_path).resolve():
+            self._mark_synced()
+
+    def close(self) -> None:
+        self.connection.close()
+
+
+BACKENDS = {
+    "json": JsonBackend,
+    "sqlite": SQLiteBackend,
+}
+
+
+def open_backend(file_path, backend: str = "json") -> StorageBackend:
+    """
+    Opens the storage backend for a connections file.
+    The JSON backend works directly on the file. The SQLite backend keeps its data in a sibling
+    '.db' file and imports the JSON file when the database is created or the file changed since the last sync.
+    :param file_path: Path to the connections JSON file.
+    :param backend: Name of the backend, one of BACKENDS.
+    :return: The opened StorageBackend.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown storage backend '{backend}'. Available backends: {', '.join(BACKENDS)}")
+    if backend == "json":
+        return JsonBackend(file_path)
+
+    storage = BACKENDS[backend](Path(file_path).with_suffix(".db"), json_path=file_path)
+    storage.sync_from_json()
+    return storage
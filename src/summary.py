@@ -0,0 +1,89 @@
+import json
+import re
+from collections import Counter
+from pathlib import Path
+
+from src.normalization import classify_title, clean_location, clean_title
+
+COMPLETION_KEYS = ("email", "phone", "website")
+
+
+def summary_path_for(file_path) -> Path:
+    """
+    Returns the path of the summary stored next to a connections file.
+    """
+    return Path(file_path).with_suffix(".summary.json")
+
+
+class ScrapeSummary:
+    def __init__(self, file_path, persons: list = None, save_every: int = 10):
+        """
+        Materialized statistics of the scraped persons, updated as each person is stored.
+        Keeps counts per country, region and title category, field completion counters and title
+        keyword counts, so the current stats can be read without cleaning and analyzing the whole file.
+        :param file_path: Path to the summary JSON file.
+        :param persons: Persons already stored; the summary is rebuilt from them if it is missing or out of date.
+        :param save_every: Number of added persons after which the summary is written to disk.
+        """
+        self.file_path = Path(file_path)
+        self.save_every = save_every
+        self._unsaved = 0
+        self.data = self._load()
+        if persons is not None and self.data["total"] != len(persons):
+            self.data = self._empty()
+            for person in persons:
+                self.add(person)
+            self.save()
+
+    @staticmethod
+    def _empty() -> dict:
+        return {
+            "total": 0,
+            "countries": {},
+            "regions": {},
+            "categories": {},
+            "completion": {key: 0 for key in COMPLETION_KEYS},
+            "title_keywords": {},
+        }
+
+    def _load(self) -> dict:
+        try:
+            with open(self.file_path, "r", encoding='utf-8') as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return self._empty()
+
+    def add(self, person: dict) -> None:
+        """
+        Adds a stored person to the summary.
+        :param person: Dictionary containing the person's data.
+        """
+        data = self.data
+        data["total"] += 1
+        location = clean_location(person.get("location"))
+        for field, counts in (("country", data["countries"]), ("region", data["regions"])):
+            if location[field]:
+                counts[location[field]] = counts.get(location[field], 0) + 1
+        category = classify_title(person.get("title"))
+        data["categories"][category] = data["categories"].get(category, 0) + 1
+        for key in COMPLETION_KEYS:
+            if person.get(key):
+                data["completion"][key] += 1
+
+        keywords = Counter()
+        for title in clean_title(person.get("title")):
+            keywords.update(re.findall(r'\b\w+\b', title.lower()))
+        for keyword, count in keywords.items():
+            data["title_keywords"][keyword] = data["title_keywords"].get(keyword, 0) + count
+
+        self._unsaved += 1
+        if self._unsaved >= self.save_every:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Writes the summary to disk.
+        """
+        with open(self.file_path, "w", encoding='utf-8') as file:
+            json.dump(self.data, file, ensure_ascii=False)
+        self._unsaved = 0
@@ -3,9 +3,10 @@ import random
 import time
 
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 
 chromeProfilePath = os.path.join(os.getcwd(), "chrome_profile", "linkedin_profile")
+# Site every page is loaded from; a local stand-in server can be used instead (see benchmarks/)
+LINKEDIN_URL = "https://www.linkedin.com"
 
 def ensure_chrome_profile():
     profile_dir = os.path.dirname(chromeProfilePath)
@@ -15,16 +16,49 @@ def ensure_chrome_profile():
         os.makedirs(chromeProfilePath)
     return chromeProfilePath
 
-def scroll_to_end(driver, times=20):
-        for _ in range(times):
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            try:
-                driver.find_element(By.CSS_SELECTOR, "div.p5").click() 
-            except:
-                pass
+SCROLL_SCRIPT = """
+    const [cardSelector, showMoreSelector] = arguments;
+    window.scrollTo(0, document.body.scrollHeight);
+    const showMore = document.querySelector(showMoreSelector);
+    if (showMore) {
+        showMore.click();
+    }
+    return {cards: document.querySelectorAll(cardSelector).length, height: document.body.scrollHeight};
+"""
+
+def scroll_until_stable(driver, card_selector, show_more_selector="div.p5", stall_seconds=3.0,
+                        poll_interval=0.5, max_seconds=900, on_progress=None):
+    """
+    Scrolls an infinite list until it stops growing.
+    Each step scrolls to the bottom, clicks the "show more" button only if it is present and reads the
+    number of cards and the page height in a single script call. Scrolling stops once neither has
+    grown for stall_seconds.
+    :param card_selector: CSS selector of the list cards.
+    :param show_more_selector: CSS selector of the "show more" button.
+    :param stall_seconds: Seconds without growth after which the list is considered complete.
+    :param poll_interval: Seconds between scroll steps.
+    :param max_seconds: Upper bound for the whole scroll.
+    :param on_progress: Optional callable receiving the card count after every step; returning True stops scrolling.
+    :return: Number of cards loaded.
+    """
+    start = last_growth = time.monotonic()
+    last_state = None
+    cards = 0
+    while True:
+        state = driver.execute_script(SCROLL_SCRIPT, card_selector, show_more_selector)
+        now = time.monotonic()
+        cards = state["cards"]
+        if (cards, state["height"]) != last_state:
+            last_state = (cards, state["height"])
+            last_growth = now
+        if on_progress and on_progress(cards):
+            break
+        if now - last_growth >= stall_seconds or now - start >= max_seconds:
+            break
+        time.sleep(poll_interval)
+    return cards
 
-def chromeBrowserOptions():
-    ensure_chrome_profile()
+def chromeBrowserOptions(use_profile: bool = True, lean: bool = False):
     options = webdriver.ChromeOptions()
     options.add_argument("--start-maximized")  
     options.add_argument("--no-sandbox")  
@@ -52,7 +86,13 @@ def chromeBrowserOptions():
     }
     options.add_experimental_option("prefs", prefs)
 
-    if len(chromeProfilePath) > 0:
+    if lean:
+        # Return from navigation at DOMContentLoaded and record the network traffic of each page
+        options.page_load_strategy = "eager"
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    if use_profile and len(chromeProfilePath) > 0:
+        ensure_chrome_profile()
         initialPath = os.path.dirname(chromeProfilePath)
         profileDir = os.path.basename(chromeProfilePath)
         options.add_argument('--user-data-dir=' + initialPath)
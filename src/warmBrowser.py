@@ -0,0 +1,89 @@
+import json
+import os
+import socket
+import time
+from pathlib import Path
+
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service as ChromeService
+
+from src.utils import chromeBrowserOptions, printyellow
+
+DRIVER_CACHE_FILE = Path("data_folder") / "driver_cache.json"
+
+
+def resolve_driver_path(cache_file: Path = DRIVER_CACHE_FILE, refresh: bool = False) -> str:
+    """
+    Returns the ChromeDriver path, resolving it with webdriver_manager only when it is not cached yet.
+    Startup therefore does no network I/O; run 'python main.py --refresh-driver' after a Chrome update.
+    :param cache_file: JSON file where the resolved path is cached.
+    :param refresh: Whether to resolve the path again even if it is cached.
+    :return: Path to the ChromeDriver executable.
+    """
+    if not refresh:
+        try:
+            with open(cache_file, "r", encoding='utf-8') as file:
+                path = json.load(file)["path"]
+            if os.path.exists(path):
+                return path
+        except (FileNotFoundError, KeyError, json.JSONDecodeError):
+            pass
+
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    with open(cache_file, "w", encoding='utf-8') as file:
+        json.dump({"path": path, "resolved_at": time.time()}, file)
+    return path
+
+
+def is_debugger_listening(debugger_address: str, timeout: float = 0.2) -> bool:
+    """
+    Checks if a Chrome started with --remote-debugging-port is listening on an address.
+    :param debugger_address: 'host:port' of the remote debugging endpoint.
+    """
+    host, port = debugger_address.rsplit(":", 1)
+    try:
+        with socket.create_connection((host, int(port)), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def attached_browser_options(debugger_address: str, lean: bool = False):
+    """
+    Options to attach to an already running Chrome instead of launching a new one.
+    Launch options (arguments, prefs, excludeSwitches) are not accepted when attaching.
+    """
+    options = webdriver.ChromeOptions()
+    options.debugger_address = debugger_address
+    if lean:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+def serve_browser(debugger_address: str) -> None:
+    """
+    Launches a detached Chrome with the persistent profile and remote debugging enabled.
+    It stays open between runs, so main.py can attach to an already started and logged-in browser.
+    Chrome is started through ChromeDriver with the full chromeBrowserOptions (arguments, prefs and
+    excludeSwitches) and the 'detach' option, so it keeps running when the driver is stopped.
+    :param debugger_address: 'host:port' where Chrome listens for remote debugging.
+    """
+    if is_debugger_listening(debugger_address):
+        printyellow(f"A browser is already listening on {debugger_address}.")
+        return
+
+    port = debugger_address.rsplit(":", 1)[1]
+    options = chromeBrowserOptions()
+    options.add_argument(f"--remote-debugging-port={port}")
+    options.add_experimental_option("detach", True)
+    driver = webdriver.Chrome(service=ChromeService(resolve_driver_path()), options=options)
+    # Stopping only the driver leaves the detached browser running
+    driver.service.stop()
+    deadline = time.monotonic() + 30
+    while not is_debugger_listening(debugger_address):
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Browser did not start listening on {debugger_address}.")
+        time.sleep(0.2)
+    printyellow(f"Browser ready on {debugger_address}.")
@@ -0,0 +1,133 @@
+import threading
+import time
+import uuid
+from collections import deque
+
+from src.fileManager import FileManager
+
+
+class LeaseError(Exception):
+    pass
+
+
+class Lease:
+    def __init__(self, profile: str, token: str, expires_at: float):
+        """
+        Exclusive right to scrape a pending connection until it expires.
+        :param profile: Connection link being scraped.
+        :param token: Unique identifier of the lease.
+        :param expires_at: Clock time after which the connection goes back to the queue.
+        """
+        self.profile = profile
+        self.token = token
+        self.expires_at = expires_at
+
+    def __repr__(self) -> str:
+        return f"Lease(profile={self.profile!r}, expires_at={self.expires_at:.1f})"
+
+
+class WorkQueue:
+    def __init__(self, file_manager: FileManager, lease_timeout: float = 300, clock=time.monotonic):
+        """
+        Queue of pending connections with claim/ack leases.
+        A connection stays in the 'connections' collection until its lease is acked, and the ack stores
+        the person and marks the connection as scraped in a single write. A run that dies mid-profile
+        therefore resumes with exactly the connections that were not stored yet.
+        The queue is thread-safe and serializes the writes of concurrent workers.
+        :param file_manager: FileManager holding the pending connections.
+        :param lease_timeout: Seconds a claimed connection stays leased before it is handed out again.
+        :param clock: Monotonic clock used for lease expiry.
+        """
+        self.fm = file_manager
+        self.lease_timeout = lease_timeout
+        self.clock = clock
+        self._pending = deque(file_manager.get_connections())
+        self._leases = {}
+        self._expiry = deque()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """
+        :return: Number of connections waiting to be claimed.
+        """
+        return len(self._pending)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._leases)
+
+    def claim(self):
+        """
+        Claims the next pending connection.
+        :return: A Lease on the connection, or None if there is nothing left to scrape.
+        """
+        with self._lock:
+            self._expire_leases()
+            while self._pending:
+                profile = self._pending.popleft()
+                if profile in self._leases or not self.fm.is_pending(profile):
+                    continue
+                lease = Lease(profile, uuid.uuid4().hex, self.clock() + self.lease_timeout)
+                self._leases[profile] = lease
+                self._expiry.append((lease.expires_at, lease))
+                return lease
+            return None
+
+    def ack(self, lease: Lease, person_data: dict) -> None:
+        """
+        Completes a lease, storing the scraped person and marking the connection as scraped.
+        A lease that expired while its page was loading is still stored if the connection is pending,
+        since the person was scraped anyway; storing is idempotent, so a worker that claimed the
+        connection again in the meantime only finds it completed.
+        :param lease: Lease returned by claim().
+        :param person_data: Dictionary containing the person's data.
+        """
+        with self._lock:
+            if self._is_current(lease):
+                self._release(lease)
+            elif not self.fm.is_pending(lease.profile):
+                return
+            self.fm.complete_connection(lease.profile, person_data)
+
+    def nack(self, lease: Lease, requeue: bool = True) -> None:
+        """
+        Gives up a lease without storing anything.
+        :param lease: Lease returned by claim().
+        :param requeue: Whether the connection goes back to the front of the queue or is left for the next run.
+        """
+        with self._lock:
+            if not self._is_current(lease):
+                # Expired leases went back to the queue already
+                return
+            self._release(lease)
+            if requeue:
+                self._pending.appendleft(lease.profile)
+
+    def extend(self, lease: Lease) -> None:
+        """
+        Renews a lease for another lease_timeout seconds.
+        :param lease: Lease returned by claim().
+        """
+        with self._lock:
+            self._check(lease)
+            lease.expires_at = self.clock() + self.lease_timeout
+            self._expiry.append((lease.expires_at, lease))
+
+    def _is_current(self, lease: Lease) -> bool:
+        return self._leases.get(lease.profile) is lease
+
+    def _check(self, lease: Lease) -> None:
+        if not self._is_current(lease):
+            raise LeaseError(f"Lease on {lease.profile} has expired or was already released.")
+
+    def _release(self, lease: Lease) -> None:
+        self._check(lease)
+        del self._leases[lease.profile]
+
+    def _expire_leases(self) -> None:
+        now = self.clock()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, lease = self._expiry.popleft()
+            if self._leases.get(lease.profile) is lease and lease.expires_at <= now:
+                del self._leases[lease.profile]
+                self._pending.appendleft(lease.profile)